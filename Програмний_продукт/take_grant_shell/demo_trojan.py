@@ -7,17 +7,26 @@
 """
 
 import sys
-import os
+from pathlib import Path
 
 # Додаємо шлях до модулів
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from modules.auth import AuthenticationModule
 from modules.objects import ObjectIdentifier
-from modules.access_graph import AccessGraph, AccessRight
+from modules.access_graph import AccessGraph, AccessRight, rights_to_symbols
 from modules.security_kernel import SecurityKernel
 from modules.operations import OperationsModule
 from modules.audit import AuditModule
+from modules.paths import DATA, LOGS
+
+
+# Права доступу як глобальні імена модуля (без пошуку атрибутів AccessRight)
+READ = AccessRight.READ
+WRITE = AccessRight.WRITE
+
+# Права, які троян надає зловмиснику
+TROJAN_RIGHTS = READ | WRITE
 
 
 def demonstrate_trojan_vulnerability():
@@ -32,12 +41,14 @@ def demonstrate_trojan_vulnerability():
     print()
     
     # Ініціалізація системи
-    auth = AuthenticationModule("data/demo_system.json")
+    DATA.mkdir(parents=True, exist_ok=True)
+    LOGS.mkdir(parents=True, exist_ok=True)
+    auth = AuthenticationModule(str(DATA / "demo_system.json"))
     objects = ObjectIdentifier()
     graph = AccessGraph()
     security = SecurityKernel(graph)
     ops = OperationsModule(objects, graph, security)
-    audit = AuditModule("logs/demo_audit.log", "data/demo_audit.json")
+    audit = AuditModule(str(LOGS / "demo_audit.log"), str(DATA / "demo_audit.jsonl"))
     
     # Крок 1: Реєстрація законного користувача
     print("Крок 1: Реєстрація законного користувача 'alice'")
@@ -55,7 +66,7 @@ def demonstrate_trojan_vulnerability():
     # Крок 3: Alice має повні права до файлу
     print("Крок 3: Перевірка прав Alice до файлу")
     rights = graph.get_rights("alice", file_id)
-    print(f"   Права Alice: {[r.value for r in rights]}")
+    print(f"   Права Alice: {rights_to_symbols(rights)}")
     print("   ✅ Alice має права r,w,x,t,g,o (всі права)\n")
     
     # Крок 4: Реєстрація зловмисника
@@ -72,8 +83,7 @@ def demonstrate_trojan_vulnerability():
     print("   Виконується: grant(secret.txt, attacker, r,w)")
     
     # Троян використовує права alice
-    success = graph.grant("alice", file_id, "attacker", 
-                         {AccessRight.READ, AccessRight.WRITE})
+    success = graph.grant("alice", file_id, "attacker", TROJAN_RIGHTS)
     
     if success:
         print("   ✅ Троян успішно надав доступ зловмиснику!")
@@ -86,7 +96,7 @@ def demonstrate_trojan_vulnerability():
     auth.logout()
     auth.login("attacker", "evil123")
     
-    can_read = security.can_access("attacker", file_id, AccessRight.READ)
+    can_read = security.can_access("attacker", file_id, READ)
     if can_read:
         print("   ✅ Зловмисник має доступ!")
         content = ops.read_file("attacker", file_id)
@@ -98,9 +108,8 @@ def demonstrate_trojan_vulnerability():
     # Крок 8: Перевірка матриці доступу
     print("Крок 8: Матриця доступу після атаки")
     print("   Права до secret.txt:")
-    for (subject, obj), rights in graph.graph.items():
-        if obj == file_id:
-            print(f"      {subject}: {[r.value for r in rights]}")
+    for subject in sorted(graph.get_object_subjects(file_id)):
+        print(f"      {subject}: {graph.rights_string(graph.get_rights(subject, file_id))}")
     
     print()
     print("=" * 80)
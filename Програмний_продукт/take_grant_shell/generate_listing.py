@@ -4,9 +4,21 @@
 """
 
 import os
+from operator import add
 from pathlib import Path
 
 
+# Кеш префіксів "   N | " для нумерації рядків (спільний для всіх файлів)
+_line_prefixes = []
+
+
+def get_line_prefixes(count: int) -> list:
+    """Отримання префіксів нумерації для рядків 1..count"""
+    for i in range(len(_line_prefixes) + 1, count + 1):
+        _line_prefixes.append(f"{i:4d} | ")
+    return _line_prefixes
+
+
 def generate_listing(output_file="ЛІСТИНГ_ПРОГРАМИ.txt"):
     """Генерація лістингу всіх файлів проекту"""
     
@@ -16,6 +28,8 @@ def generate_listing(output_file="ЛІСТИНГ_ПРОГРАМИ.txt"):
     # Файли для включення (тільки .py файли)
     files_to_include = [
         "main.py",
+        "modules/paths.py",
+        "modules/_json_cache.py",
         "modules/auth.py",
         "modules/objects.py",
         "modules/access_graph.py",
@@ -26,7 +40,7 @@ def generate_listing(output_file="ЛІСТИНГ_ПРОГРАМИ.txt"):
         "modules/cli.py",
     ]
     
-    with open(output_path, 'w', encoding='utf-8') as out:
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
         out.write("=" * 80 + "\n")
         out.write("ЛІСТИНГ ПРОГРАМНОГО ПРОДУКТУ\n")
         out.write("Операційна оболонка з моделлю Take-Grant\n")
@@ -44,10 +58,10 @@ def generate_listing(output_file="ЛІСТИНГ_ПРОГРАМИ.txt"):
             
             with open(full_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
-                
-                for i, line in enumerate(lines, 1):
-                    # Формат: номер рядка | вміст
-                    out.write(f"{i:4d} | {line}")
+            
+            # Формат: номер рядка | вміст (одним записом на файл)
+            prefixes = get_line_prefixes(len(lines))
+            out.write("".join(map(add, prefixes, lines)))
             
             out.write("\n")
     
@@ -3,12 +3,13 @@
 Головний файл запуску операційної оболонки Take-Grant
 """
 
-import os
 import sys
+from pathlib import Path
 
 # Додаємо поточну директорію до шляху
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+from modules.paths import DATA, LOGS, SYSTEM_JSON, AUDIT_LOG, AUDIT_JSON
 from modules.auth import AuthenticationModule
 from modules.objects import ObjectIdentifier
 from modules.access_graph import AccessGraph
@@ -24,21 +25,12 @@ def main():
     # Ініціалізація всіх модулів
     print("Ініціалізація системи...")
     
-    # Визначаємо шляхи до файлів даних
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(base_dir, "data")
-    logs_dir = os.path.join(base_dir, "logs")
-    
     # Створюємо директорії якщо не існують
-    os.makedirs(data_dir, exist_ok=True)
-    os.makedirs(logs_dir, exist_ok=True)
-    
-    data_file = os.path.join(data_dir, "system.json")
-    audit_log = os.path.join(logs_dir, "audit.log")
-    audit_json = os.path.join(data_dir, "audit.json")
+    DATA.mkdir(parents=True, exist_ok=True)
+    LOGS.mkdir(parents=True, exist_ok=True)
     
     # Ініціалізація модулів
-    auth_module = AuthenticationModule(data_file)
+    auth_module = AuthenticationModule(str(SYSTEM_JSON))
     object_identifier = ObjectIdentifier()
     access_graph = AccessGraph()
     security_kernel = SecurityKernel(access_graph)
@@ -48,7 +40,7 @@ def main():
     admin_module = AdminModule(
         auth_module, object_identifier, access_graph, security_kernel
     )
-    audit_module = AuditModule(audit_log, audit_json)
+    audit_module = AuditModule(str(AUDIT_LOG), str(AUDIT_JSON))
     
     # Завантаження даних (якщо потрібно)
     # TODO: Додати завантаження графа доступу та об'єктів з файлу
@@ -5,24 +5,23 @@
 
 import json
 import sys
-import os
+
+from modules._json_cache import load_json_cached, save_json
+from modules.paths import SYSTEM_JSON
 
 def make_admin(username: str):
     """Надання прав адміністратора користувачу"""
     
-    # Шлях до файлу
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_file = os.path.join(script_dir, "data", "system.json")
+    data_file = str(SYSTEM_JSON)
     
     # Перевірка існування файлу
-    if not os.path.exists(data_file):
+    if not SYSTEM_JSON.exists():
         print(f"Помилка: файл {data_file} не знайдено")
         return False
     
     # Завантаження даних
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_cached(data_file)
     except json.JSONDecodeError:
         print(f"Помилка: не вдалося прочитати {data_file}")
         return False
@@ -33,13 +32,17 @@ def make_admin(username: str):
         print(f"Доступні користувачі: {list(data.get('users', {}).keys())}")
         return False
     
+    # Якщо користувач вже адміністратор - файл не перезаписуємо
+    if data['users'][username].get('is_admin'):
+        print(f"Користувач '{username}' вже є адміністратором")
+        return True
+    
     # Надання прав адміністратора
     data['users'][username]['is_admin'] = True
     
     # Збереження
     try:
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_json(data_file, data)
         print(f"✅ Користувач '{username}' тепер адміністратор!")
         return True
     except IOError:
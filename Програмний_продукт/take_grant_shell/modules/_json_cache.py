@@ -0,0 +1,87 @@
+"""
+Завантаження та збереження JSON-файлів даних системи
+
+Якщо встановлено orjson, він використовується для розбору та серіалізації;
+інакше - стандартний модуль json з тим самим форматом файлів.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson - необов'язкова залежність
+    orjson = None
+
+
+def load_json(path: str):
+    """
+    Завантаження JSON-файлу
+
+    Raises:
+        json.JSONDecodeError: якщо вміст файлу не є коректним JSON
+    """
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def loads_json(content: bytes):
+    """Розбір JSON-документа з байтів"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_json_line(data) -> bytes:
+    """Серіалізація у компактний однорядковий JSON (для JSONL-файлів)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_json(data, pretty: bool = False) -> bytes:
+    """
+    Серіалізація у JSON (UTF-8, без екранування)
+    
+    Args:
+        data: Дані для серіалізації
+        pretty: Форматувати з відступом 2 пробіли (для перегляду людиною);
+            за замовчуванням - компактний запис без відступів
+    """
+    if not pretty:
+        return dumps_json_line(data)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def save_json(path: str, data, pretty: bool = False):
+    """Збереження даних у JSON-файл (pretty - з відступами, див. dumps_json)"""
+    with open(path, 'wb') as f:
+        f.write(dumps_json(data, pretty))
+
+
+@lru_cache(maxsize=64)
+def _load_json(path: str, mtime_ns: int) -> dict:
+    """Розбір JSON-файлу (кешується за парою шлях + час зміни)"""
+    return load_json(path)
+
+
+def load_json_cached(path: str) -> dict:
+    """
+    Завантаження JSON-файлу з кешуванням
+
+    Повторне завантаження незміненого файлу не розбирає його заново.
+    Після запису у файл змінюється st_mtime_ns, тому наступний виклик
+    прочитає нову версію. Повернений об'єкт спільний для всіх викликів
+    з тим самим ключем - змінювати його можна тільки з подальшим
+    записом у файл.
+
+    Args:
+        path: Шлях до JSON-файлу
+
+    Returns:
+        Розібраний вміст файлу
+    """
+    return _load_json(path, os.stat(path).st_mtime_ns)
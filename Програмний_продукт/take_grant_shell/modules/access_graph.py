@@ -2,18 +2,107 @@
 Модуль графа доступу для моделі Take-Grant
 """
 
-from typing import Dict, Set, Optional, List, Tuple
-from enum import Enum
+import sys
+from array import array
+from collections import deque
+from itertools import accumulate
+from typing import Dict, Set, Optional, List, Tuple, Iterable
+from enum import IntFlag
 
 
-class AccessRight(Enum):
-    """Права доступу в моделі Take-Grant"""
-    READ = "r"      # Читання
-    WRITE = "w"     # Запис
-    EXECUTE = "x"   # Виконання
-    TAKE = "t"      # Право брати права
-    GRANT = "g"     # Право надавати права
-    OWN = "o"       # Право власності
+class AccessRight(IntFlag):
+    """
+    Права доступу в моделі Take-Grant
+
+    Кожне право - окремий біт, тому множина прав зберігається як одне
+    ціле число, а об'єднання/перетин виконуються операціями | та &.
+    """
+    READ = 1        # Читання
+    WRITE = 2       # Запис
+    EXECUTE = 4     # Виконання
+    TAKE = 8        # Право брати права
+    GRANT = 16      # Право надавати права
+    OWN = 32        # Право власності
+    ALL = 63        # Всі права
+
+
+# Порожня маска прав (спільний незмінний екземпляр)
+NO_RIGHTS = AccessRight(0)
+
+# Біти прав 't' та 'g' як звичайні цілі: у графі маски зберігаються як int,
+# і операції & над ними виконуються без методів IntFlag
+TAKE_BIT = int(AccessRight.TAKE)
+GRANT_BIT = int(AccessRight.GRANT)
+
+# Порожня множина сусідів для вершин без ребер (спільний незмінний екземпляр)
+_NO_NODES: frozenset = frozenset()
+
+# Позначення прав у порядку бітів (r, w, x, t, g, o)
+RIGHT_SYMBOLS = "rwxtgo"
+
+
+def rights_to_symbols(rights: int) -> List[str]:
+    """
+    Перетворення маски прав у список позначень
+
+    Args:
+        rights: Маска прав доступу
+
+    Returns:
+        Список позначень прав, наприклад ['r', 'w']
+    """
+    return [symbol for bit, symbol in enumerate(RIGHT_SYMBOLS) if rights >> bit & 1]
+
+
+# Рядкове представлення для кожної з 64 масок: 'rw-t-o' тощо
+_RIGHTS_STRINGS = [
+    "".join(symbol if mask >> bit & 1 else "-" for bit, symbol in enumerate(RIGHT_SYMBOLS))
+    for mask in range(AccessRight.ALL + 1)
+]
+
+
+def _compress(node_count: int, rows, cols, masks) -> Tuple[array, array, array]:
+    """
+    Стиснення списку ребер у CSR-масиви (сортування підрахунком за рядком)
+    
+    Args:
+        node_count: Кількість вузлів
+        rows: Індекси початкових вершин ребер
+        cols: Індекси кінцевих вершин ребер
+        masks: Маски прав ребер
+        
+    Returns:
+        Кортеж (ptr, idx, masks) - зміщення рядків, вершини та маски
+    """
+    # Кількість ребер у кожному рядку -> зміщення рядків
+    counts = [0] * (node_count + 1)
+    for row in rows:
+        counts[row + 1] += 1
+    ptr = array('l', accumulate(counts))
+    
+    # Розкладаємо ребра по рядках
+    next_pos = ptr[:-1]
+    idx = array('l', [0]) * len(rows)
+    out_masks = array('B', bytes(len(rows)))
+    for row, col, mask in zip(rows, cols, masks):
+        pos = next_pos[row]
+        next_pos[row] = pos + 1
+        idx[pos] = col
+        out_masks[pos] = mask
+    return ptr, idx, out_masks
+
+
+# Автомат слів мостів Take-Grant: t→*, t←*, t→* g→ t←*, t→* g← t←*.
+# Для кожного стану - переходи (право, напрямок ребра, новий стан);
+# напрямок 0 - ребро веде від поточної вершини, 1 - до поточної вершини.
+# Стани: 0 - початок, 1 - прочитано t→*, 2 - прочитано t←*, 3 - прочитано g.
+_BRIDGE_AUTOMATON = (
+    ((TAKE_BIT, 0, 1), (TAKE_BIT, 1, 2),
+     (GRANT_BIT, 0, 3), (GRANT_BIT, 1, 3)),
+    ((TAKE_BIT, 0, 1), (GRANT_BIT, 0, 3), (GRANT_BIT, 1, 3)),
+    ((TAKE_BIT, 1, 2),),
+    ((TAKE_BIT, 1, 3),),
+)
 
 
 class AccessGraph:
@@ -21,21 +110,192 @@ class AccessGraph:
     Граф доступу для моделі Take-Grant
     
     Граф представлений як словник, де ключ - це пара (subject_id, object_id),
-    а значення - множина прав доступу.
+    а значення - маска прав доступу (AccessRight).
+
+    Для масових обходів (матриця доступу, список ребер) з словника ліниво
+    будується CSR-представлення (Compressed Sparse Row): вузлам призначаються
+    цілі індекси, ребра суб'єкта i лежать у col_idx[row_ptr[i]:row_ptr[i + 1]],
+    а відповідні маски прав - у rights_arr.
     """
     
     def __init__(self):
         """Ініціалізація графа доступу"""
-        # Граф: (subject_id, object_id) -> Set[AccessRight]
-        self.graph: Dict[Tuple[str, str], Set[AccessRight]] = {}
-        # Для швидкого пошуку: subject_id -> Set[object_id]
-        self.subject_edges: Dict[str, Set[str]] = {}
-        # Для швидкого пошуку: object_id -> Set[subject_id]
-        self.object_edges: Dict[str, Set[str]] = {}
-    
-    def _normalize_edge(self, subject_id: str, object_id: str) -> Tuple[str, str]:
-        """Нормалізація ребра графа"""
-        return (subject_id, object_id)
+        # Граф: (subject_id, object_id) -> маска прав (біти AccessRight як int)
+        self.graph: Dict[Tuple[str, str], int] = {}
+        # Індекси суміжності, оновлюються при створенні та видаленні ребер
+        # (лише непорожні множини): subject_id -> Set[object_id]
+        self.objects_by_subject: Dict[str, Set[str]] = {}
+        # object_id -> Set[subject_id]
+        self.subjects_by_object: Dict[str, Set[str]] = {}
+        # Цілочисельні індекси вузлів: node_id -> index та index -> node_id
+        self.node_index: Dict[str, int] = {}
+        self.nodes: List[str] = []
+        # Лічильник поколінь: збільшується при кожній зміні графа,
+        # похідні представлення перебудовуються при зміні покоління
+        self._gen = 0
+        # CSR-представлення графа та покоління, для якого воно побудоване
+        self.row_ptr = array('l', [0])
+        self.col_idx = array('l')
+        self.rights_arr = array('B')
+        self._csr_gen = 0
+        # Транспоноване представлення (вхідні ребра), будується на вимогу
+        self._csc: Optional[Tuple[array, array, array]] = None
+        # Список ребер для get_all_edges: (покоління, ребра)
+        self._edges_cache: Tuple[int, List[Tuple[str, str, AccessRight]]] = (-1, [])
+    
+    @property
+    def version(self) -> int:
+        """
+        Версія графа: змінюється при кожній зміні прав
+        
+        Дозволяє зовнішнім кешам (наприклад, ядра безпеки) визначати,
+        чи збережені результати ще актуальні.
+        """
+        return self._gen
+    
+    def _node(self, node_id: str) -> int:
+        """Отримання (або призначення) цілочисельного індексу вузла"""
+        index = self.node_index.get(node_id)
+        if index is None:
+            index = len(self.nodes)
+            self.node_index[node_id] = index
+            self.nodes.append(node_id)
+        return index
+    
+    def _build_csr(self):
+        """Перебудова CSR-представлення з словника ребер"""
+        node_index = self.node_index
+        rows = [node_index[subject_id] for subject_id, _ in self.graph]
+        cols = [node_index[object_id] for _, object_id in self.graph]
+        
+        self.row_ptr, self.col_idx, self.rights_arr = _compress(
+            len(self.nodes), rows, cols, self.graph.values())
+        self._csc = None
+        self._csr_gen = self._gen
+    
+    def csr_is_current(self) -> bool:
+        """Чи побудоване CSR-представлення для поточного покоління графа"""
+        return self._csr_gen == self._gen
+    
+    def get_csr(self) -> Tuple[array, array, array]:
+        """
+        Отримання CSR-представлення графа
+        
+        Returns:
+            Кортеж (row_ptr, col_idx, rights_arr); індекси вузлів
+            відповідають списку self.nodes
+        """
+        if self._csr_gen != self._gen:
+            self._build_csr()
+        return self.row_ptr, self.col_idx, self.rights_arr
+    
+    def get_csc(self) -> Tuple[array, array, array]:
+        """
+        Отримання транспонованого CSR-представлення (вхідні ребра вершин)
+        
+        Returns:
+            Кортеж (col_ptr, row_idx, rights); ребра, що ведуть до вершини j,
+            лежать у row_idx[col_ptr[j]:col_ptr[j + 1]]
+        """
+        if self._csr_gen != self._gen or self._csc is None:
+            subjects, objects, rights = self.export_soa()
+            self._csc = _compress(len(self.nodes), objects, subjects, rights)
+        return self._csc
+    
+    def tg_reachable(self, source_id: str, target_id: str) -> bool:
+        """
+        Перевірка tg-зв'язності двох вершин
+        
+        Вершини tg-зв'язні, якщо між ними існує шлях з ребер, що містять
+        право 't' або 'g', без урахування напрямку ребер. Пошук у ширину
+        виконується по CSR-масивах та транспонованих до них.
+        
+        Args:
+            source_id: ID початкової вершини
+            target_id: ID кінцевої вершини
+            
+        Returns:
+            True якщо вершини tg-зв'язні
+        """
+        if source_id == target_id:
+            return True
+        
+        start = self.node_index.get(source_id)
+        goal = self.node_index.get(target_id)
+        if start is None or goal is None:
+            return False
+        
+        tg_mask = TAKE_BIT | GRANT_BIT
+        adjacency = (self.get_csr(), self.get_csc())
+        visited = bytearray(len(self.nodes))
+        visited[start] = 1
+        queue = deque([start])
+        
+        while queue:
+            node = queue.popleft()
+            for ptr, idx, masks in adjacency:
+                for pos in range(ptr[node], ptr[node + 1]):
+                    if not masks[pos] & tg_mask:
+                        continue
+                    neighbor = idx[pos]
+                    if neighbor == goal:
+                        return True
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        queue.append(neighbor)
+        
+        return False
+    
+    def find_bridges(self, subject_ids: Optional[Iterable[str]] = None
+                     ) -> List[Tuple[str, str]]:
+        """
+        Пошук мостів між суб'єктами
+        
+        Міст - tg-шлях між двома суб'єктами, слово якого має вигляд
+        t→*, t←*, t→* g→ t←* або t→* g← t←*. Для кожного суб'єкта
+        виконується пошук у ширину по парах (вершина, стан автомата слів).
+        
+        Args:
+            subject_ids: ID суб'єктів (за замовчуванням - всі вершини,
+                         які мають вихідні ребра)
+            
+        Returns:
+            Список пар (subject_id, subject_id), з'єднаних мостом
+        """
+        row_ptr, _, _ = self.get_csr()
+        adjacency = (self.get_csr(), self.get_csc())
+        nodes = self.nodes
+        
+        if subject_ids is None:
+            subjects = [i for i in range(len(nodes)) if row_ptr[i] < row_ptr[i + 1]]
+        else:
+            subjects = [self.node_index[s] for s in subject_ids if s in self.node_index]
+        subject_set = set(subjects)
+        
+        bridges = []
+        for start in subjects:
+            seen = {(start, 0)}
+            queue = deque(seen)
+            reached = set()
+            
+            while queue:
+                node, state = queue.popleft()
+                for right, direction, next_state in _BRIDGE_AUTOMATON[state]:
+                    ptr, idx, masks = adjacency[direction]
+                    for pos in range(ptr[node], ptr[node + 1]):
+                        if not masks[pos] & right:
+                            continue
+                        step = (idx[pos], next_state)
+                        if step not in seen:
+                            seen.add(step)
+                            queue.append(step)
+                            reached.add(idx[pos])
+            
+            reached.discard(start)
+            bridges.extend((nodes[start], nodes[end])
+                           for end in sorted(reached & subject_set))
+        
+        return bridges
     
     def add_right(self, subject_id: str, object_id: str, right: AccessRight):
         """
@@ -44,23 +304,47 @@ class AccessGraph:
         Args:
             subject_id: ID суб'єкта
             object_id: ID об'єкта
-            right: Право доступу
+            right: Право доступу (або маска з кількох прав)
         """
-        edge = self._normalize_edge(subject_id, object_id)
+        self._or_mask(subject_id, object_id, right)
+    
+    def _or_mask(self, subject_id: str, object_id: str, mask: AccessRight):
+        """Додавання маски прав до ребра одним оновленням графа"""
+        mask = int(mask)
+        if not mask:
+            return  # Порожня маска не створює ребра і не змінює граф
         
-        if edge not in self.graph:
-            self.graph[edge] = set()
+        edge = (subject_id, object_id)
+        rights = self.graph.get(edge)
+        
+        if rights is None:
+            # Нове ребро - індекси оновлюються один раз на пару вершин
+            edge = self._touch_indices(subject_id, object_id)
+            self.graph[edge] = mask
+        else:
+            self.graph[edge] = rights | mask
+        self._gen += 1
+    
+    def _touch_indices(self, subject_id: str, object_id: str) -> Tuple[str, str]:
+        """
+        Реєстрація нового ребра в індексах графа
         
-        self.graph[edge].add(right)
+        Returns:
+            Ребро з інтернованими ID для використання як ключ графа
+        """
+        # Ключі графа інтернуються: рядки з однаковим вмістом стають одним
+        # об'єктом, тож пошук у словнику порівнює їх за ідентичністю
+        subject_id = sys.intern(subject_id)
+        object_id = sys.intern(object_id)
         
-        # Оновлюємо індекси для швидкого пошуку
-        if subject_id not in self.subject_edges:
-            self.subject_edges[subject_id] = set()
-        self.subject_edges[subject_id].add(object_id)
+        self._node(subject_id)
+        self._node(object_id)
         
-        if object_id not in self.object_edges:
-            self.object_edges[object_id] = set()
-        self.object_edges[object_id].add(subject_id)
+        # Оновлюємо індекси суміжності
+        self.objects_by_subject.setdefault(subject_id, set()).add(object_id)
+        self.subjects_by_object.setdefault(object_id, set()).add(subject_id)
+        
+        return (subject_id, object_id)
     
     def remove_right(self, subject_id: str, object_id: str, right: AccessRight):
         """
@@ -69,18 +353,60 @@ class AccessGraph:
         Args:
             subject_id: ID суб'єкта
             object_id: ID об'єкта
-            right: Право доступу
+            right: Право доступу (або маска з кількох прав)
         """
-        edge = self._normalize_edge(subject_id, object_id)
+        edge = (subject_id, object_id)
         
         if edge in self.graph:
-            self.graph[edge].discard(right)
+            self.graph[edge] &= ~int(right)
+            self._gen += 1
             
-            # Якщо множина прав порожня, видаляємо ребро
+            # Якщо прав не залишилось, видаляємо ребро
             if not self.graph[edge]:
                 del self.graph[edge]
-                self.subject_edges[subject_id].discard(object_id)
-                self.object_edges[object_id].discard(subject_id)
+                self._discard_index(self.objects_by_subject, subject_id, object_id)
+                self._discard_index(self.subjects_by_object, object_id, subject_id)
+    
+    def remove_node_edges(self, node_id: str) -> int:
+        """
+        Видалення всіх ребер вузла (вхідних і вихідних), наприклад при
+        видаленні об'єкта
+        
+        Ребра знаходяться за індексами суміжності - O(степінь вузла)
+        замість перегляду всього графа; покоління змінюється один раз.
+        
+        Args:
+            node_id: ID вузла
+            
+        Returns:
+            Кількість видалених ребер
+        """
+        graph = self.graph
+        removed = 0
+        
+        # Вхідні ребра: (s, node_id)
+        for subject_id in self.subjects_by_object.pop(node_id, ()):
+            del graph[(subject_id, node_id)]
+            self._discard_index(self.objects_by_subject, subject_id, node_id)
+            removed += 1
+        
+        # Вихідні ребра: (node_id, o); петля (node_id, node_id) вже видалена
+        for object_id in self.objects_by_subject.pop(node_id, ()):
+            del graph[(node_id, object_id)]
+            self._discard_index(self.subjects_by_object, object_id, node_id)
+            removed += 1
+        
+        if removed:
+            self._gen += 1
+        return removed
+    
+    @staticmethod
+    def _discard_index(index: Dict[str, Set[str]], key: str, node_id: str):
+        """Видалення вузла з індексу суміжності (порожня множина видаляється)"""
+        nodes = index[key]
+        nodes.discard(node_id)
+        if not nodes:
+            del index[key]
     
     def has_right(self, subject_id: str, object_id: str, right: AccessRight) -> bool:
         """
@@ -89,15 +415,17 @@ class AccessGraph:
         Args:
             subject_id: ID суб'єкта
             object_id: ID об'єкта
-            right: Право доступу
+            right: Право доступу (або маска з кількох прав)
             
         Returns:
-            True якщо право існує
+            True якщо існують усі права з маски; для порожньої маски - False
         """
-        edge = self._normalize_edge(subject_id, object_id)
-        return edge in self.graph and right in self.graph[edge]
+        right = int(right)
+        if not right:
+            return False
+        return (self.graph.get((subject_id, object_id), 0) & right) == right
     
-    def get_rights(self, subject_id: str, object_id: str) -> Set[AccessRight]:
+    def get_rights(self, subject_id: str, object_id: str) -> AccessRight:
         """
         Отримання всіх прав суб'єкта до об'єкта
         
@@ -106,13 +434,13 @@ class AccessGraph:
             object_id: ID об'єкта
             
         Returns:
-            Множина прав доступу
+            Маска прав доступу; для відсутнього ребра - NO_RIGHTS
         """
-        edge = self._normalize_edge(subject_id, object_id)
-        return self.graph.get(edge, set())
+        rights = self.graph.get((subject_id, object_id))
+        return NO_RIGHTS if rights is None else AccessRight(rights)
     
     def take(self, subject_id: str, source_object_id: str, target_object_id: str, 
-             rights: Set[AccessRight]) -> bool:
+             rights: AccessRight) -> bool:
         """
         Операція Take: суб'єкт бере права від source_object до target_object
         
@@ -123,31 +451,29 @@ class AccessGraph:
             subject_id: ID суб'єкта, який виконує операцію
             source_object_id: ID об'єкта, від якого беруться права
             target_object_id: ID об'єкта, до якого беруться права
-            rights: Множина прав, які потрібно взяти
+            rights: Маска прав, які потрібно взяти
             
         Returns:
             True якщо операція успішна
         """
+        graph = self.graph
+        
         # Перевірка: чи має subject право 't' до source_object
-        if not self.has_right(subject_id, source_object_id, AccessRight.TAKE):
+        if not graph.get((subject_id, source_object_id), 0) & TAKE_BIT:
             return False
         
-        # Перевірка: чи має source_object права до target_object
-        source_rights = self.get_rights(source_object_id, target_object_id)
-        if not source_rights:
+        # Беремо тільки ті права, які є у source_object до target_object;
+        # порожній перетин - операція нічого не змінює
+        available_rights = rights & graph.get((source_object_id, target_object_id), 0)
+        if not available_rights:
             return False
         
-        # Беремо тільки ті права, які є у source_object
-        available_rights = rights.intersection(source_rights)
-        
         # Додаємо права subject до target_object
-        for right in available_rights:
-            self.add_right(subject_id, target_object_id, right)
-        
-        return len(available_rights) > 0
+        self._or_mask(subject_id, target_object_id, available_rights)
+        return True
     
     def grant(self, subject_id: str, source_object_id: str, target_subject_id: str,
-              rights: Set[AccessRight]) -> bool:
+              rights: AccessRight) -> bool:
         """
         Операція Grant: суб'єкт надає права від source_object іншому суб'єкту
         
@@ -158,31 +484,31 @@ class AccessGraph:
             subject_id: ID суб'єкта, який виконує операцію
             source_object_id: ID об'єкта, права від якого надаються
             target_subject_id: ID суб'єкта, якому надаються права
-            rights: Множина прав, які потрібно надати
+            rights: Маска прав, які потрібно надати
             
         Returns:
             True якщо операція успішна
         """
+        # Маска subject до source_object потрібна і для перевірки 'g',
+        # і для визначення прав, що надаються - читаємо її один раз
+        subject_rights = self.graph.get((subject_id, source_object_id), 0)
+        
         # Перевірка: чи має subject право 'g' до source_object
-        if not self.has_right(subject_id, source_object_id, AccessRight.GRANT):
+        if not subject_rights & GRANT_BIT:
             return False
         
-        # Перевірка: чи має subject права до source_object
-        subject_rights = self.get_rights(subject_id, source_object_id)
-        if not subject_rights:
+        # Надаємо тільки ті права, які є у subject до source_object;
+        # порожній перетин - операція нічого не змінює
+        available_rights = rights & subject_rights
+        if not available_rights:
             return False
         
-        # Надаємо тільки ті права, які є у subject
-        available_rights = rights.intersection(subject_rights)
-        
         # Додаємо права target_subject до source_object
-        for right in available_rights:
-            self.add_right(target_subject_id, source_object_id, right)
-        
-        return len(available_rights) > 0
+        self._or_mask(target_subject_id, source_object_id, available_rights)
+        return True
     
     def create(self, subject_id: str, object_id: str, 
-               rights: Set[AccessRight] = None) -> bool:
+               rights: AccessRight = AccessRight.ALL) -> bool:
         """
         Операція Create: суб'єкт створює об'єкт і отримує до нього всі права
         
@@ -194,46 +520,84 @@ class AccessGraph:
         Returns:
             True якщо операція успішна
         """
-        if rights is None:
-            # За замовчуванням надаємо всі права
-            rights = {AccessRight.READ, AccessRight.WRITE, AccessRight.EXECUTE,
-                     AccessRight.TAKE, AccessRight.GRANT, AccessRight.OWN}
-        
-        for right in rights:
-            self.add_right(subject_id, object_id, right)
+        self._or_mask(subject_id, object_id, rights)
         
         return True
     
-    def remove(self, subject_id: str, object_id: str, rights: Set[AccessRight]):
+    def remove(self, subject_id: str, object_id: str, rights: AccessRight):
         """
         Операція Remove: видалення прав доступу
         
         Args:
             subject_id: ID суб'єкта
             object_id: ID об'єкта
-            rights: Множина прав для видалення
+            rights: Маска прав для видалення
         """
-        for right in rights:
-            self.remove_right(subject_id, object_id, right)
+        self.remove_right(subject_id, object_id, rights)
     
-    def get_all_edges(self) -> List[Tuple[str, str, Set[AccessRight]]]:
+    def get_all_edges(self) -> List[Tuple[str, str, AccessRight]]:
         """
         Отримання всіх ребер графа
         
+        Список запам'ятовується до наступної зміни графа, тому повторні
+        перегляди (наприклад, виведення матриці) не будують його заново.
+        Повернений список спільний - його не слід змінювати.
+        
         Returns:
             Список кортежів (subject_id, object_id, rights)
         """
-        result = []
-        for (subject_id, object_id), rights in self.graph.items():
-            if rights:  # Тільки якщо є права
-                result.append((subject_id, object_id, rights))
-        return result
+        gen, edges = self._edges_cache
+        if gen != self._gen:
+            nodes = self.nodes
+            edges = [(nodes[s], nodes[o], AccessRight(rights))
+                     for s, o, rights in zip(*self.export_soa())]
+            self._edges_cache = (self._gen, edges)
+        return edges
+    
+    def export_soa(self) -> Tuple[array, array, array]:
+        """
+        Експорт ребер графа у вигляді окремих масивів (Struct-of-Arrays)
+        
+        Масиви об'єктів та прав - це безпосередньо col_idx та rights_arr
+        CSR-представлення (без копіювання); масив суб'єктів розгортається
+        з row_ptr. Індекси вузлів відповідають списку self.nodes.
+        
+        Returns:
+            Кортеж (subjects, objects, rights)
+        """
+        row_ptr, col_idx, rights_arr = self.get_csr()
+        
+        subjects = array('l')
+        for row in range(len(row_ptr) - 1):
+            subjects.extend(array('l', [row]) * (row_ptr[row + 1] - row_ptr[row]))
+        return subjects, col_idx, rights_arr
+    
+    @staticmethod
+    def rights_string(rights: int) -> str:
+        """
+        Рядкове представлення маски прав фіксованої довжини
+        
+        Args:
+            rights: Маска прав доступу
+            
+        Returns:
+            Рядок на зразок 'rw-t-o' (прочерк - права немає)
+        """
+        return _RIGHTS_STRINGS[rights]
     
     def get_subject_objects(self, subject_id: str) -> Set[str]:
-        """Отримання всіх об'єктів, до яких має доступ суб'єкт"""
-        return self.subject_edges.get(subject_id, set())
+        """
+        Отримання всіх об'єктів, до яких має доступ суб'єкт
+        
+        Повертається сам індекс графа без копіювання - лише для читання.
+        """
+        return self.objects_by_subject.get(subject_id, _NO_NODES)
     
     def get_object_subjects(self, object_id: str) -> Set[str]:
-        """Отримання всіх суб'єктів, які мають доступ до об'єкта"""
-        return self.object_edges.get(object_id, set())
+        """
+        Отримання всіх суб'єктів, які мають доступ до об'єкта
+        
+        Повертається сам індекс графа без копіювання - лише для читання.
+        """
+        return self.subjects_by_object.get(object_id, _NO_NODES)
 
@@ -2,10 +2,10 @@
 Модуль адміністратора для управління системою
 """
 
-from typing import List, Optional
+from typing import Iterator
 from .auth import AuthenticationModule
 from .objects import ObjectIdentifier
-from .access_graph import AccessGraph, AccessRight
+from .access_graph import AccessGraph, AccessRight, rights_to_symbols
 from .security_kernel import SecurityKernel
 
 
@@ -55,38 +55,39 @@ class AdminModule:
         self.auth_module.set_admin(target_username, is_admin)
         return True
     
-    def list_all_users(self, admin_username: str) -> List[str]:
+    def list_all_users(self, admin_username: str) -> Iterator[str]:
         """
-        Отримання списку всіх користувачів
+        Перелік всіх користувачів (генератор, без побудови списку)
         
         Args:
             admin_username: Ім'я адміністратора
             
         Returns:
-            Список імен користувачів
+            Ітератор імен користувачів
         """
         if not self.is_admin(admin_username):
-            return []
+            return
         
-        return self.auth_module.list_users()
+        yield from self.auth_module.iter_users()
     
-    def list_all_objects(self, admin_username: str) -> List[dict]:
+    def list_all_objects(self, admin_username: str) -> Iterator[dict]:
         """
-        Отримання списку всіх об'єктів
+        Перелік всіх об'єктів (генератор, без побудови списку)
         
         Args:
             admin_username: Ім'я адміністратора
             
         Returns:
-            Список об'єктів
+            Ітератор словників з даними об'єктів
         """
         if not self.is_admin(admin_username):
-            return []
+            return
         
-        return self.object_identifier.list_objects()
+        for obj in self.object_identifier.objects.values():
+            yield obj.to_dict()
     
     def grant_rights(self, admin_username: str, subject_id: str, 
-                    object_id: str, rights: set) -> bool:
+                    object_id: str, rights: AccessRight) -> bool:
         """
         Надання прав доступу (адміністративна операція)
         
@@ -94,7 +95,7 @@ class AdminModule:
             admin_username: Ім'я адміністратора
             subject_id: ID суб'єкта
             object_id: ID об'єкта
-            rights: Множина прав доступу
+            rights: Маска прав доступу
             
         Returns:
             True якщо операція успішна
@@ -102,13 +103,12 @@ class AdminModule:
         if not self.is_admin(admin_username):
             return False
         
-        for right in rights:
-            self.access_graph.add_right(subject_id, object_id, right)
+        self.access_graph.add_right(subject_id, object_id, rights)
         
         return True
     
     def revoke_rights(self, admin_username: str, subject_id: str,
-                     object_id: str, rights: set) -> bool:
+                     object_id: str, rights: AccessRight) -> bool:
         """
         Відкликання прав доступу (адміністративна операція)
         
@@ -116,7 +116,7 @@ class AdminModule:
             admin_username: Ім'я адміністратора
             subject_id: ID суб'єкта
             object_id: ID об'єкта
-            rights: Множина прав для відкликання
+            rights: Маска прав для відкликання
             
         Returns:
             True якщо операція успішна
@@ -124,33 +124,30 @@ class AdminModule:
         if not self.is_admin(admin_username):
             return False
         
-        for right in rights:
-            self.access_graph.remove_right(subject_id, object_id, right)
+        self.access_graph.remove_right(subject_id, object_id, rights)
         
         return True
     
-    def get_access_matrix(self, admin_username: str) -> List[dict]:
+    def get_access_matrix(self, admin_username: str) -> Iterator[dict]:
         """
-        Отримання матриці доступу
+        Перелік записів матриці доступу (генератор, без побудови списку)
         
         Args:
             admin_username: Ім'я адміністратора
             
         Returns:
-            Список записів матриці доступу
+            Ітератор записів матриці доступу
         """
         if not self.is_admin(admin_username):
-            return []
+            return
         
-        matrix = []
-        for (subject_id, object_id), rights in self.access_graph.graph.items():
-            matrix.append({
-                'subject': subject_id,
-                'object': object_id,
-                'rights': [r.value for r in rights]
-            })
+        nodes = self.access_graph.nodes
+        subjects, objects, rights = self.access_graph.export_soa()
         
-        return matrix
+        for s, o, r in zip(subjects, objects, rights):
+            yield {'subject': nodes[s],
+                   'object': nodes[o],
+                   'rights': rights_to_symbols(r)}
     
     def delete_user(self, admin_username: str, target_username: str) -> bool:
         """
@@ -170,8 +167,9 @@ class AdminModule:
             return False  # Не можна видалити себе
         
         # Перевірка чи користувач має об'єкти
-        user_objects = self.object_identifier.get_objects_by_owner(target_username)
-        if user_objects:
+        # Достатньо знайти перший об'єкт - повний список не будується
+        user_objects = self.object_identifier.iter_objects(owner=target_username)
+        if next(user_objects, None) is not None:
             return False  # Не можна видалити користувача з об'єктами
         
         # Видалення користувача (в реальній системі тут була б логіка видалення)
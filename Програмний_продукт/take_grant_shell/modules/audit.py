@@ -3,11 +3,17 @@
 """
 
 import os
-import json
-from datetime import datetime
-from typing import List, Optional
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+from itertools import islice
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 from enum import Enum
 
+from ._json_cache import loads_json, dumps_json_line
+
 
 class EventType(Enum):
     """Типи подій для аудиту"""
@@ -26,44 +32,398 @@ class EventType(Enum):
     ADMIN_ACTION = "admin_action"
 
 
+# Максимальна кількість подій, що записуються у файли за один раз
+_BATCH_SIZE = 512
+
+# Пауза фонового запису перед повторною спробою після помилки вводу-виводу (с)
+_RETRY_DELAY = 1.0
+
+# Кеш частини мітки часу до секунд: (секунда епохи, "YYYY-MM-DDTHH:MM:SS")
+_ts_cache = (None, "")
+
+
+def _timestamp() -> str:
+    """
+    Поточний час у форматі datetime.now().isoformat()
+    
+    Дата й час до секунд форматуються один раз на секунду; для подій
+    у межах тієї самої секунди дописуються лише мікросекунди.
+    """
+    global _ts_cache
+    now = time.time()
+    seconds = int(now)
+    micros = round((now - seconds) * 1e6)
+    if micros >= 1000000:
+        seconds += 1
+        micros -= 1000000
+    
+    cached_seconds, prefix = _ts_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        _ts_cache = (seconds, prefix)
+    
+    # isoformat не додає дробову частину, якщо мікросекунд рівно 0
+    if micros:
+        return f"{prefix}.{micros:06d}"
+    return prefix
+
+
 class AuditModule:
     """
     Модуль аудиту для протоколювання подій системи
+    
+    Події зберігаються у файлі формату JSON Lines (один JSON-об'єкт на
+    рядок), тому збереження лише дописує нові події в кінець файлу.
+    
+    log_event лише додає подію до пам'яті та черги запису; у файли події
+    пакетами записує фоновий потік. save_events примусово дописує чергу,
+    а при завершенні програми черга дописується автоматично (atexit).
+    
+    Історія подій читається з файлу лише при першому зверненні до неї;
+    tail та count_events працюють без завантаження всього журналу.
     """
     
     def __init__(self, log_file: str = "logs/audit.log",
-                 json_file: str = "data/audit.json"):
+                 jsonl_file: str = "data/audit.jsonl"):
         """
         Ініціалізація модуля аудиту
         
         Args:
             log_file: Шлях до текстового лог-файлу
-            json_file: Шлях до JSON файлу з подіями
+            jsonl_file: Шлях до JSONL файлу з подіями
         """
         self.log_file = log_file
-        self.json_file = json_file
-        self.events: List[dict] = []
-        self.load_events()
+        self.jsonl_file = jsonl_file
+        # Події журналу; None - історія ще не завантажена з файлу
+        self._events: Optional[List[dict]] = None
+        # Кількість подій, якщо відома без завантаження історії
+        self._event_count: Optional[int] = None
+        # Індекси для фільтрації: позиції подій у self.events (за зростанням)
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_subject: Dict[str, List[int]] = {}
+        self._failed_ids: List[int] = []
+        self._success_ids: List[int] = []
+        # Події, які ще не дописані у файли (захищені self._cond):
+        # пари (подія, серіалізований рядок JSONL)
+        self._queue: Deque[Tuple[dict, bytes]] = deque()
+        self._cond = threading.Condition()
+        # Послідовний запис пакетів: порядок подій у файлах зберігається
+        self._write_lock = threading.Lock()
+        self._closed = False
+        
+        # Директорії створюються один раз, а не при кожній події
+        for path in (self.log_file, self.jsonl_file):
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        
+        # Файли журналу відкриті весь час роботи модуля. Запис іде напряму
+        # в дескриптори, без буферизації Python: пакет записується одним
+        # викликом, і при помилці відомо, скільки байтів уже у файлі
+        self._jsonl_fd = self._open_append(self.jsonl_file)
+        self._log_fd = self._open_append(self.log_file)
+        # Останній рядок JSONL обірваний (запис перервала помилка або
+        # завершення процесу) - наступний запис почнеться з нового рядка
+        self._jsonl_torn = not self._ends_with_newline(self.jsonl_file)
+        
+        self._writer = threading.Thread(target=self._writer_loop,
+                                        name="audit-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+    
+    @property
+    def events(self) -> List[dict]:
+        """Всі події журналу (завантажуються з файлу при першому зверненні)"""
+        if self._events is None:
+            self._ensure_loaded()
+        return self._events
+    
+    def _ensure_loaded(self):
+        """Завантаження історії подій, якщо вона ще не в пам'яті"""
+        if self._events is None:
+            # Події з черги спершу дописуються, щоб файл містив увесь журнал
+            self.save_events()
+            self.load_events()
+    
+    @staticmethod
+    def _ends_with_newline(path: str) -> bool:
+        """Чи закінчується файл символом нового рядка (порожній файл - так)"""
+        with open(path, 'rb') as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    @staticmethod
+    def _parse_event(line: bytes) -> Optional[dict]:
+        """
+        Розбір одного рядка JSONL файлу
+        
+        Returns:
+            Подія або None, якщо рядок порожній чи пошкоджений (наприклад,
+            обірваний останній рядок після аварійного завершення)
+        """
+        if not line.strip():
+            return None
+        try:
+            event = loads_json(line)
+        except ValueError:  # JSONDecodeError та помилки декодування UTF-8
+            return None
+        return event if isinstance(event, dict) else None
     
     def load_events(self):
-        """Завантаження подій з JSON файлу"""
-        if os.path.exists(self.json_file):
+        """
+        Завантаження подій з JSONL файлу
+        
+        Кожен рядок розбирається окремо: пошкоджені рядки пропускаються
+        (з попередженням у stderr), решта історії зберігається.
+        """
+        events = []
+        skipped = 0
+        try:
+            with open(self.jsonl_file, 'rb') as f:
+                for line in f:
+                    event = self._parse_event(line)
+                    if event is not None:
+                        events.append(event)
+                    elif line.strip():
+                        skipped += 1
+        except IOError:
+            pass
+        if skipped:
+            print(f"Попередження: пропущено пошкоджених рядків журналу аудиту: {skipped}",
+                  file=sys.stderr)
+        
+        self._events = events
+        self._event_count = len(events)
+        self._rebuild_index()
+    
+    def count_events(self, success_only: bool = False) -> int:
+        """
+        Кількість подій у журналі
+        
+        Рахуються ті самі рядки, що приймає load_events (пошкоджені
+        пропускаються).
+        
+        Args:
+            success_only: Рахувати тільки успішні події (за індексом;
+                інакше - без збереження історії в пам'яті)
+        """
+        if success_only:
+            self._ensure_loaded()
+            return len(self._success_ids)
+        if self._event_count is None:
+            self.save_events()
             try:
-                with open(self.json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.events = data.get('events', [])
-            except (json.JSONDecodeError, IOError):
-                self.events = []
+                with open(self.jsonl_file, 'rb') as f:
+                    self._event_count = sum(1 for line in f
+                                            if self._parse_event(line) is not None)
+            except IOError:
+                self._event_count = 0
+        return self._event_count
+    
+    def tail(self, n: int = 20) -> List[dict]:
+        """
+        Отримання останніх n подій
+        
+        Якщо історія ще не завантажена, файл читається потоково і
+        розбираються лише останні n рядків; пошкоджені рядки пропускаються
+        (тоді події шукаються розбором усього файлу).
+        
+        Args:
+            n: Кількість подій
+            
+        Returns:
+            Список подій у хронологічному порядку
+        """
+        if self._events is not None:
+            return self._events[-n:] if n > 0 else []
+        
+        if n <= 0:
+            return []
+        
+        self.save_events()
+        parse = self._parse_event
+        try:
+            with open(self.jsonl_file, 'rb') as f:
+                lines = deque((line for line in f if line.strip()), maxlen=n)
+                events = [event for event in map(parse, lines) if event is not None]
+                if len(events) < len(lines):
+                    # Серед останніх рядків є пошкоджені - добираємо
+                    # попередні події, розбираючи файл повністю
+                    f.seek(0)
+                    events = list(deque((event for event in map(parse, f)
+                                         if event is not None), maxlen=n))
+            return events
+        except IOError:
+            return []
+    
+    def recent(self, n: int = 20,
+               predicate: Optional[Callable[[dict], bool]] = None) -> List[dict]:
+        """
+        Отримання останніх n подій, що задовольняють умову
+        
+        Журнал переглядається з кінця і лише до n-ї знайденої події,
+        без копіювання всього списку.
+        
+        Args:
+            n: Кількість подій
+            predicate: Умова відбору (None - всі події)
+            
+        Returns:
+            Список подій у хронологічному порядку
+        """
+        if predicate is None:
+            return self.tail(n)
+        
+        result = list(islice(filter(predicate, reversed(self.events)), max(n, 0)))
+        result.reverse()
+        return result
+    
+    def _rebuild_index(self):
+        """Побудова індексів фільтрації для всіх подій журналу"""
+        events = self.events
+        self._by_type = {}
+        self._by_subject = {}
+        self._failed_ids = []
+        self._success_ids = []
+        for position, event in enumerate(events):
+            self._index_event(position, event)
+    
+    def _index_event(self, position: int, event: dict):
+        """Додавання події до індексів фільтрації"""
+        self._by_type.setdefault(event['type'], []).append(position)
+        self._by_subject.setdefault(event['subject'], []).append(position)
+        if event['success']:
+            self._success_ids.append(position)
         else:
-            os.makedirs(os.path.dirname(self.json_file), exist_ok=True)
-            self.events = []
+            self._failed_ids.append(position)
     
     def save_events(self):
-        """Збереження подій у JSON файл"""
-        os.makedirs(os.path.dirname(self.json_file), exist_ok=True)
-        data = {'events': self.events}
-        with open(self.json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """
+        Дописування всіх подій з черги у файли
+        
+        Після повернення всі події, запротокольовані до виклику,
+        записані у JSONL файл та текстовий лог.
+        """
+        while self._write_batch():
+            pass
+    
+    def close(self):
+        """Зупинка фонового запису з дописуванням черги та закриття файлів"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._writer.join()
+        self.save_events()
+        os.close(self._jsonl_fd)
+        os.close(self._log_fd)
+    
+    def compact(self):
+        """
+        Перезапис JSONL файлу поточним вмістом журналу
+        
+        Звичайне збереження лише дописує події; compact переписує файл
+        повністю (наприклад, після ручного редагування self.events).
+        Викликається тільки явно.
+        """
+        self.save_events()
+        self._rebuild_index()
+        with self._write_lock:
+            tmp_file = self.jsonl_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(b"".join(dumps_json_line(event) + b"\n" for event in self.events))
+            
+            os.close(self._jsonl_fd)
+            os.replace(tmp_file, self.jsonl_file)
+            self._jsonl_fd = self._open_append(self.jsonl_file)
+            self._jsonl_torn = False
+    
+    @staticmethod
+    def _open_append(path: str) -> int:
+        """Відкриття файлу для дописування (дескриптор з O_APPEND)"""
+        return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    def _writer_loop(self):
+        """
+        Фоновий потік: очікує нові події та записує їх пакетами
+        
+        Помилка запису не зупиняє потік: вона виводиться у stderr,
+        незаписані події лишаються в черзі, а запис повторюється
+        після паузи _RETRY_DELAY.
+        """
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            try:
+                self._write_batch()
+            except Exception as e:
+                print(f"Помилка запису журналу аудиту: {e}", file=sys.stderr)
+                with self._cond:
+                    if not self._closed:
+                        self._cond.wait(_RETRY_DELAY)
+    
+    def _write_batch(self) -> bool:
+        """
+        Запис одного пакета подій з черги у файли
+        
+        Raises:
+            OSError: якщо запис у файли не вдався (незаписані у JSONL
+                події пакета повертаються на початок черги)
+        
+        Returns:
+            True якщо було що записувати
+        """
+        with self._write_lock:
+            with self._cond:
+                queue = self._queue
+                batch = [queue.popleft() for _ in range(min(len(queue), _BATCH_SIZE))]
+            if not batch:
+                return False
+            
+            self._append_events(batch)
+            # JSONL файл - основне сховище журналу; подія, вже записана туди,
+            # не повторюється навіть якщо не вдався запис текстового логу
+            self._write_log([event for event, _ in batch])
+            return True
+    
+    def _append_events(self, batch: List[Tuple[dict, bytes]]):
+        """
+        Дописування пакета подій у JSONL файл
+        
+        Raises:
+            OSError: якщо запис не вдався; події, не записані повністю,
+                повертаються на початок черги
+        """
+        # Після обірваного запису нова подія починається з нового рядка файлу
+        prefix = b"\n" if self._jsonl_torn else b""
+        data = prefix + b"".join(line for _, line in batch)
+        view = memoryview(data)
+        try:
+            # Пакет потрапляє у файл одним записом (повтор лише при частковому)
+            while view:
+                view = view[os.write(self._jsonl_fd, view):]
+        except OSError:
+            written = len(data) - len(view) - len(prefix)
+            if written >= 0:
+                # Скільки подій записано повністю; решта - обірваний рядок
+                done = 0
+                for _, line in batch:
+                    if written < len(line):
+                        break
+                    written -= len(line)
+                    done += 1
+                self._jsonl_torn = written > 0
+                batch = batch[done:]
+            with self._cond:
+                self._queue.extendleft(reversed(batch))
+            raise
+        self._jsonl_torn = False
     
     def log_event(self, event_type: EventType, subject: str, 
                   details: dict = None, success: bool = True):
@@ -77,35 +437,44 @@ class AuditModule:
             success: Чи була операція успішною
         """
         event = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _timestamp(),
             'type': event_type.value,
             'subject': subject,
             'success': success,
             'details': details or {}
         }
+        # Серіалізація у викликаючому потоці: некоректні деталі (наприклад,
+        # множина) дають помилку тут, а не у фоновому записі
+        line = dumps_json_line(event) + b"\n"
         
-        self.events.append(event)
-        
-        # Зберігаємо у JSON
-        self.save_events()
+        if self._events is not None:
+            self._index_event(len(self._events), event)
+            self._events.append(event)
+        if self._event_count is not None:
+            self._event_count += 1
         
-        # Записуємо у текстовий лог
-        self._write_log(event)
+        # Запис у JSONL та текстовий лог виконує фоновий потік
+        with self._cond:
+            self._queue.append((event, line))
+            self._cond.notify()
     
-    def _write_log(self, event: dict):
-        """Запис події у текстовий лог-файл"""
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-        
+    @staticmethod
+    def _format_log_line(event: dict) -> str:
+        """Форматування події як рядка текстового логу"""
         status = "SUCCESS" if event['success'] else "FAILED"
         details_str = ""
         if event['details']:
             details_str = " | " + ", ".join([f"{k}={v}" for k, v in event['details'].items()])
         
-        log_line = f"[{event['timestamp']}] {status} | {event['type']} | " \
-                  f"subject={event['subject']}{details_str}\n"
-        
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_line)
+        return f"[{event['timestamp']}] {status} | {event['type']} | " \
+               f"subject={event['subject']}{details_str}\n"
+    
+    def _write_log(self, batch: List[dict]):
+        """Запис пакета подій у текстовий лог-файл"""
+        data = "".join(map(self._format_log_line, batch)).encode('utf-8')
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._log_fd, view):]
     
     def get_events(self, event_type: Optional[EventType] = None,
                    subject: Optional[str] = None,
@@ -123,21 +492,39 @@ class AuditModule:
         Returns:
             Список подій
         """
-        result = self.events.copy()
+        self._ensure_loaded()
+        events = self._events
         
-        if event_type:
-            result = [e for e in result if e['type'] == event_type.value]
+        type_value = event_type.value if event_type else None
+        subject = subject or None
         
-        if subject:
-            result = [e for e in result if e['subject'] == subject]
+        # Найменший зі списків позицій, що відповідають заданим фільтрам
+        positions = None
+        if type_value is not None:
+            positions = self._by_type.get(type_value, [])
+        if subject is not None:
+            by_subject = self._by_subject.get(subject, [])
+            if positions is None or len(by_subject) < len(positions):
+                positions = by_subject
+        if success_only and (positions is None or len(self._success_ids) < len(positions)):
+            positions = self._success_ids
+        if failed_only and (positions is None or len(self._failed_ids) < len(positions)):
+            positions = self._failed_ids
         
-        if success_only:
-            result = [e for e in result if e['success']]
+        if positions is None:
+            return events.copy()
         
-        if failed_only:
-            result = [e for e in result if not e['success']]
+        def matches(e: dict) -> bool:
+            return ((type_value is None or e['type'] == type_value) and
+                    (subject is None or e['subject'] == subject) and
+                    (not success_only or e['success']) and
+                    (not failed_only or not e['success']))
         
-        return result
+        # Решта фільтрів перевіряється одним проходом. Якщо індекс відсіює
+        # менше половини подій, послідовний перегляд списку дешевший
+        if len(positions) * 2 > len(events):
+            return [e for e in events if matches(e)]
+        return [e for e in map(events.__getitem__, positions) if matches(e)]
     
     def get_failed_accesses(self) -> List[dict]:
         """Отримання всіх неуспішних спроб доступу"""
@@ -145,7 +532,7 @@ class AuditModule:
     
     def get_successful_operations(self) -> List[dict]:
         """Отримання всіх успішних операцій"""
-        return [e for e in self.events if e['success']]
+        return self.get_events(success_only=True)
     
     def get_all_events(self) -> List[dict]:
         """Отримання всіх подій"""
@@ -153,11 +540,19 @@ class AuditModule:
     
     def clear_events(self):
         """Очищення журналу подій"""
-        self.events = []
-        self.save_events()
-        
-        # Очищаємо текстовий лог
-        if os.path.exists(self.log_file):
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                f.write("")
+        # Під блокуванням запису фоновий потік не може бути посеред пакета:
+        # черга й файли очищуються між пакетами
+        with self._write_lock:
+            with self._cond:
+                self._events = []
+                self._event_count = 0
+                self._queue.clear()
+            self._rebuild_index()
+            
+            # Очищаємо файл подій (порожній файл не має обірваного рядка)
+            os.ftruncate(self._jsonl_fd, 0)
+            self._jsonl_torn = False
+            
+            # Очищаємо текстовий лог
+            os.ftruncate(self._log_fd, 0)
 
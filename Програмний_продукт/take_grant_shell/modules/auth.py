@@ -2,14 +2,38 @@
 Модуль реєстрації та авторизації суб'єктів
 """
 
+import atexit
 import hashlib
+import hmac
 import json
 import os
-from typing import Dict, Optional
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
+
+from ._json_cache import load_json_cached, save_json
+
+
+@lru_cache(maxsize=1024)
+def _sha256_digest(password: str) -> bytes:
+    """
+    SHA-256 пароля у вигляді 32 байтів (з кешуванням)
+    
+    Увага: ключами кешу є паролі у відкритому вигляді, тож вони
+    зберігаються у пам'яті процесу. Це прийнятно лише для навчальної
+    оболонки, де пам'ять процесу вважається довіреною.
+    """
+    return hashlib.sha256(password.encode()).digest()
 
 
 class AuthenticationModule:
-    """Модуль для реєстрації та авторизації користувачів"""
+    """
+    Модуль для реєстрації та авторизації користувачів
+    
+    Зміни користувачів накопичуються в пам'яті й записуються у файл
+    викликом save_data (або close - автоматично при завершенні програми).
+    """
     
     def __init__(self, data_file: str = "data/system.json"):
         """
@@ -20,35 +44,72 @@ class AuthenticationModule:
         """
         self.data_file = data_file
         self.users: Dict[str, Dict] = {}
+        # Збережені хеші паролів у вигляді байтів (для порівняння при вході)
+        self._hash_bytes: Dict[str, bytes] = {}
         self.current_user: Optional[str] = None
+        # Чи є незбережені зміни у даних користувачів
+        self._dirty = False
+        
+        # Директорія даних створюється один раз, а не при кожному збереженні
+        directory = os.path.dirname(self.data_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
         self.load_data()
+        atexit.register(self.close)
     
-    def _hash_password(self, password: str) -> str:
-        """Хешування пароля"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _hash_password(self, password: str) -> bytes:
+        """
+        Хешування пароля
+        
+        Повертає 32 байти SHA-256; у файлі хеш зберігається шістнадцятковим
+        рядком (сумісно з наявними даними), перетворення лише при записі.
+        """
+        return _sha256_digest(password)
     
     def load_data(self):
         """Завантаження даних користувачів з файлу"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.users = data.get('users', {})
+                data = load_json_cached(self.data_file)
+                # Копіюємо записи, щоб зміни не торкались кешованого об'єкта
+                self.users = {username: dict(record)
+                              for username, record in data.get('users', {}).items()}
             except (json.JSONDecodeError, IOError):
                 self.users = {}
         else:
-            # Створюємо директорію якщо не існує
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
             self.users = {}
+        
+        # Хеші декодуються один раз при завантаженні, а не при кожному вході.
+        # Запис без коректного хеша пропускається: вхід цього користувача
+        # неможливий, решта системи працює як звичайно
+        self._hash_bytes = {}
+        for username, record in self.users.items():
+            try:
+                self._hash_bytes[username] = bytes.fromhex(record['password_hash'])
+            except (KeyError, TypeError, ValueError):
+                print(f"Попередження: некоректний хеш пароля користувача '{username}'",
+                      file=sys.stderr)
     
-    def save_data(self):
-        """Збереження даних користувачів у файл"""
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+    def save_data(self, pretty: bool = False):
+        """
+        Збереження даних користувачів у файл (тільки якщо були зміни)
+        
+        Args:
+            pretty: Записати JSON з відступами для перегляду людиною
+        """
+        if not self._dirty:
+            return
+        
         data = {
             'users': self.users
         }
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_json(self.data_file, data, pretty)
+        self._dirty = False
+    
+    def close(self):
+        """Збереження незбережених змін перед завершенням роботи"""
+        self.save_data()
     
     def register(self, username: str, password: str) -> bool:
         """
@@ -64,12 +125,14 @@ class AuthenticationModule:
         if username in self.users:
             return False
         
+        password_hash = self._hash_password(password)
+        self._hash_bytes[username] = password_hash
         self.users[username] = {
-            'password_hash': self._hash_password(password),
+            'password_hash': password_hash.hex(),
             'is_admin': False,
-            'created_at': str(os.path.getmtime(self.data_file) if os.path.exists(self.data_file) else 0)
+            'created_at': datetime.now().isoformat()
         }
-        self.save_data()
+        self._dirty = True
         return True
     
     def login(self, username: str, password: str) -> bool:
@@ -83,11 +146,12 @@ class AuthenticationModule:
         Returns:
             True якщо авторизація успішна, False інакше
         """
-        if username not in self.users:
+        stored_hash = self._hash_bytes.get(username)
+        if stored_hash is None:
             return False
         
-        password_hash = self._hash_password(password)
-        if self.users[username]['password_hash'] == password_hash:
+        # Порівняння за сталий час - не залежить від позиції першої розбіжності
+        if hmac.compare_digest(self._hash_password(password), stored_hash):
             self.current_user = username
             return True
         return False
@@ -126,9 +190,13 @@ class AuthenticationModule:
         """
         if username in self.users:
             self.users[username]['is_admin'] = is_admin
-            self.save_data()
+            self._dirty = True
     
     def list_users(self) -> list:
         """Отримання списку всіх користувачів"""
         return list(self.users.keys())
+    
+    def iter_users(self) -> Iterator[str]:
+        """Перелік імен користувачів без побудови списку"""
+        return iter(self.users)
 
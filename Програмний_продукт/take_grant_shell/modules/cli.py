@@ -2,16 +2,94 @@
 Консольний інтерфейс (CLI) для операційної оболонки Take-Grant
 """
 
+import sys
 from typing import Optional
 from .auth import AuthenticationModule
 from .objects import ObjectIdentifier, ObjectType
-from .access_graph import AccessGraph, AccessRight
+from .access_graph import AccessGraph, AccessRight, NO_RIGHTS
 from .security_kernel import SecurityKernel
 from .operations import OperationsModule
 from .admin import AdminModule
 from .audit import AuditModule, EventType
 
 
+# Права доступу як глобальні імена модуля (без пошуку атрибутів AccessRight)
+READ = AccessRight.READ
+WRITE = AccessRight.WRITE
+EXECUTE = AccessRight.EXECUTE
+TAKE = AccessRight.TAKE
+GRANT = AccessRight.GRANT
+OWN = AccessRight.OWN
+
+# Символ права -> AccessRight
+_RIGHT_MAP = {
+    'r': READ,
+    'w': WRITE,
+    'x': EXECUTE,
+    't': TAKE,
+    'g': GRANT,
+    'o': OWN
+}
+
+
+def _parse_rights(rights_str: str) -> AccessRight:
+    """
+    Розбір рядка прав виду "r,w,t" у маску AccessRight
+    
+    Невідомі символи ігноруються.
+    """
+    rights = NO_RIGHTS
+    # Рядок нормалізується один раз, а не кожен символ окремо
+    for r in rights_str.lower().replace(' ', '').split(','):
+        rights |= _RIGHT_MAP.get(r, NO_RIGHTS)
+    return rights
+
+
+# Значення, яке повертає обробник команди для завершення головного циклу
+_EXIT = object()
+
+# Запрошення командного рядка для неавторизованого користувача
+_ANONYMOUS_PROMPT = "[не авторизовано]> "
+
+# Текст довідки по командам (виводиться одним викликом print)
+_HELP_TEXT = """
+=== Довідка по командам ===
+Автентифікація:
+  register <username> <password>  - Реєстрація нового користувача
+  login <username> <password>      - Авторизація
+  logout                           - Вихід з системи
+
+Робота з об'єктами:
+  create_file <name>               - Створення файлу
+  create_dir <name>                - Створення каталогу
+  read <object_id>                 - Читання файлу
+  write <object_id> <content>      - Запис у файл
+  delete <object_id>               - Видалення об'єкта
+  list                             - Список об'єктів
+
+Операції Take-Grant:
+  take <source> <target> <rights>  - Операція take
+  grant <source> <target> <rights>   - Операція grant
+  check <object_id> <right>         - Перевірка доступу
+
+Адміністративні команди:
+  admin list_users                  - Список користувачів
+  admin list_objects                - Список всіх об'єктів
+  admin matrix                     - Матриця доступу
+  admin grant <s> <o> <rights>     - Надання прав
+
+Аудит:
+  audit all                        - Всі події
+  audit failed                     - Неуспішні доступи
+  audit success                    - Успішні операції
+
+Інші:
+  help                             - Ця довідка
+  exit                             - Вихід з програми
+================================
+"""
+
+
 class CLI:
     """Консольний інтерфейс користувача"""
     
@@ -41,39 +119,43 @@ class CLI:
         self.ops = operations_module
         self.admin = admin_module
         self.audit = audit_module
-        self.current_user_id: Optional[str] = None
+        self._current_user_id: Optional[str] = None
+        # Запрошення командного рядка змінюється лише при вході/виході
+        self._prompt = _ANONYMOUS_PROMPT
+        
+        # Команда -> обробник, який приймає список аргументів
+        self._dispatch = {
+            'exit': self._do_exit,
+            'help': lambda args: self.print_help(),
+            'register': self.handle_register,
+            'login': self.handle_login,
+            'logout': lambda args: self.handle_logout(),
+            'create_file': self.handle_create_file,
+            'create_dir': self.handle_create_directory,
+            'read': self.handle_read,
+            'write': self.handle_write,
+            'delete': self.handle_delete,
+            'list': lambda args: self.handle_list(),
+            'take': self.handle_take,
+            'grant': self.handle_grant,
+            'check': self.handle_check,
+            'admin': self.handle_admin,
+            'audit': self.handle_audit,
+        }
+    
+    @property
+    def current_user_id(self) -> Optional[str]:
+        """ID авторизованого користувача (None - не авторизовано)"""
+        return self._current_user_id
+    
+    @current_user_id.setter
+    def current_user_id(self, user_id: Optional[str]):
+        self._current_user_id = user_id
+        self._prompt = f"[{user_id}]> " if user_id else _ANONYMOUS_PROMPT
     
     def print_help(self):
         """Виведення довідки"""
-        print("\n=== Довідка по командам ===")
-        print("Автентифікація:")
-        print("  register <username> <password>  - Реєстрація нового користувача")
-        print("  login <username> <password>      - Авторизація")
-        print("  logout                           - Вихід з системи")
-        print("\nРобота з об'єктами:")
-        print("  create_file <name>               - Створення файлу")
-        print("  create_dir <name>                - Створення каталогу")
-        print("  read <object_id>                 - Читання файлу")
-        print("  write <object_id> <content>      - Запис у файл")
-        print("  delete <object_id>               - Видалення об'єкта")
-        print("  list                             - Список об'єктів")
-        print("\nОперації Take-Grant:")
-        print("  take <source> <target> <rights>  - Операція take")
-        print("  grant <source> <target> <rights>   - Операція grant")
-        print("  check <object_id> <right>         - Перевірка доступу")
-        print("\nАдміністративні команди:")
-        print("  admin list_users                  - Список користувачів")
-        print("  admin list_objects                - Список всіх об'єктів")
-        print("  admin matrix                     - Матриця доступу")
-        print("  admin grant <s> <o> <rights>     - Надання прав")
-        print("\nАудит:")
-        print("  audit all                        - Всі події")
-        print("  audit failed                     - Неуспішні доступи")
-        print("  audit success                    - Успішні операції")
-        print("\nІнші:")
-        print("  help                             - Ця довідка")
-        print("  exit                             - Вихід з програми")
-        print("================================\n")
+        print(_HELP_TEXT)
     
     def run(self):
         """Головний цикл CLI"""
@@ -82,73 +164,24 @@ class CLI:
         
         while True:
             try:
-                if self.current_user_id:
-                    prompt = f"[{self.current_user_id}]> "
-                else:
-                    prompt = "[не авторизовано]> "
-                
-                command = input(prompt).strip()
+                command = input(self._prompt).strip()
                 
                 if not command:
                     continue
                 
-                parts = command.split()
+                # Для вибору обробника потрібне лише перше слово;
+                # аргументи розбиваються тільки для відомої команди
+                parts = command.split(None, 1)
                 cmd = parts[0].lower()
-                args = parts[1:]
-                
-                if cmd == "exit":
-                    if self.current_user_id:
-                        self.audit.log_event(EventType.LOGOUT, self.current_user_id)
-                    print("До побачення!")
-                    break
-                
-                elif cmd == "help":
-                    self.print_help()
-                
-                elif cmd == "register":
-                    self.handle_register(args)
-                
-                elif cmd == "login":
-                    self.handle_login(args)
-                
-                elif cmd == "logout":
-                    self.handle_logout()
-                
-                elif cmd == "create_file":
-                    self.handle_create_file(args)
-                
-                elif cmd == "create_dir":
-                    self.handle_create_directory(args)
-                
-                elif cmd == "read":
-                    self.handle_read(args)
-                
-                elif cmd == "write":
-                    self.handle_write(args)
-                
-                elif cmd == "delete":
-                    self.handle_delete(args)
-                
-                elif cmd == "list":
-                    self.handle_list()
-                
-                elif cmd == "take":
-                    self.handle_take(args)
-                
-                elif cmd == "grant":
-                    self.handle_grant(args)
                 
-                elif cmd == "check":
-                    self.handle_check(args)
-                
-                elif cmd == "admin":
-                    self.handle_admin(args)
-                
-                elif cmd == "audit":
-                    self.handle_audit(args)
-                
-                else:
+                handler = self._dispatch.get(cmd)
+                if handler is None:
                     print(f"Невідома команда: {cmd}. Введіть 'help' для довідки.")
+                    continue
+                
+                args = parts[1].split() if len(parts) > 1 else []
+                if handler(args) is _EXIT:
+                    break
             
             except KeyboardInterrupt:
                 print("\n\nВихід з програми...")
@@ -156,6 +189,13 @@ class CLI:
             except Exception as e:
                 print(f"Помилка: {e}")
     
+    def _do_exit(self, args):
+        """Обробка виходу з програми"""
+        if self.current_user_id:
+            self.audit.log_event(EventType.LOGOUT, self.current_user_id)
+        print("До побачення!")
+        return _EXIT
+    
     def require_auth(self) -> bool:
         """Перевірка чи користувач авторизований"""
         if not self.current_user_id:
@@ -185,7 +225,7 @@ class CLI:
         
         username, password = args[0], args[1]
         if self.auth.login(username, password):
-            self.current_user_id = username
+            self.current_user_id = sys.intern(username)
             print(f"Вітаємо, {username}!")
             self.audit.log_event(EventType.LOGIN, username)
         else:
@@ -296,18 +336,30 @@ class CLI:
         
         user_objects = self.objects.get_objects_by_owner(self.current_user_id)
         if user_objects:
-            print("\nВаші об'єкти:")
-            for obj in user_objects:
-                print(f"  {obj['name']} ({obj['type']}) - ID: {obj['id']}")
+            print("\n".join([
+                "\nВаші об'єкти:",
+                *(f"  {obj.name} ({obj.type}) - ID: {obj.id}"
+                  for obj in user_objects)]))
         else:
             print("У вас немає об'єктів")
     
-    def handle_take(self, args):
-        """Обробка операції take"""
+    def _tg(self, op_name: str, graph_fn, event_type: EventType,
+            target_name: str, verb: str, args):
+        """
+        Спільна обробка операцій take та grant
+        
+        Args:
+            op_name: Назва операції (take або grant)
+            graph_fn: Метод графа, що виконує операцію
+            event_type: Тип події аудиту для успішної операції
+            target_name: Назва другого аргументу у підказці використання
+            verb: Дієслово для повідомлення про успіх
+            args: Аргументи команди
+        """
         if not self.require_auth():
             return
         if len(args) < 3:
-            print("Використання: take <source_object> <target_object> <rights>")
+            print(f"Використання: {op_name} <source_object> <{target_name}> <rights>")
             print("  rights: r,w,x,t,g,o (через кому)")
             return
         
@@ -315,66 +367,22 @@ class CLI:
         target = args[1]
         rights_str = args[2]
         
-        # Парсинг прав
-        rights = set()
-        for r in rights_str.split(','):
-            r = r.strip().lower()
-            if r == 'r':
-                rights.add(AccessRight.READ)
-            elif r == 'w':
-                rights.add(AccessRight.WRITE)
-            elif r == 'x':
-                rights.add(AccessRight.EXECUTE)
-            elif r == 't':
-                rights.add(AccessRight.TAKE)
-            elif r == 'g':
-                rights.add(AccessRight.GRANT)
-            elif r == 'o':
-                rights.add(AccessRight.OWN)
-        
-        if self.graph.take(self.current_user_id, source, target, rights):
-            print(f"Операція take успішна: отримано права {rights_str} від {source} до {target}")
-            self.audit.log_event(EventType.TAKE_OPERATION, self.current_user_id,
+        if graph_fn(self.current_user_id, source, target, _parse_rights(rights_str)):
+            print(f"Операція {op_name} успішна: {verb} права {rights_str} від {source} до {target}")
+            self.audit.log_event(event_type, self.current_user_id,
                                {'source': source, 'target': target, 'rights': rights_str})
         else:
-            print("Помилка: операція take не вдалася")
+            print(f"Помилка: операція {op_name} не вдалася")
+    
+    def handle_take(self, args):
+        """Обробка операції take"""
+        self._tg("take", self.graph.take, EventType.TAKE_OPERATION,
+                 "target_object", "отримано", args)
     
     def handle_grant(self, args):
         """Обробка операції grant"""
-        if not self.require_auth():
-            return
-        if len(args) < 3:
-            print("Використання: grant <source_object> <target_subject> <rights>")
-            print("  rights: r,w,x,t,g,o (через кому)")
-            return
-        
-        source = args[0]
-        target = args[1]
-        rights_str = args[2]
-        
-        # Парсинг прав
-        rights = set()
-        for r in rights_str.split(','):
-            r = r.strip().lower()
-            if r == 'r':
-                rights.add(AccessRight.READ)
-            elif r == 'w':
-                rights.add(AccessRight.WRITE)
-            elif r == 'x':
-                rights.add(AccessRight.EXECUTE)
-            elif r == 't':
-                rights.add(AccessRight.TAKE)
-            elif r == 'g':
-                rights.add(AccessRight.GRANT)
-            elif r == 'o':
-                rights.add(AccessRight.OWN)
-        
-        if self.graph.grant(self.current_user_id, source, target, rights):
-            print(f"Операція grant успішна: надано права {rights_str} від {source} до {target}")
-            self.audit.log_event(EventType.GRANT_OPERATION, self.current_user_id,
-                               {'source': source, 'target': target, 'rights': rights_str})
-        else:
-            print("Помилка: операція grant не вдалася")
+        self._tg("grant", self.graph.grant, EventType.GRANT_OPERATION,
+                 "target_subject", "надано", args)
     
     def handle_check(self, args):
         """Обробка перевірки доступу"""
@@ -382,26 +390,18 @@ class CLI:
             return
         if len(args) < 2:
             print("Використання: check <object_id> <right>")
-            print("  right: r,w,x,t,g,o")
+            print("  right: r,w,x,t,g,o (кілька прав - через кому)")
             return
         
         obj_id = args[0]
         right_str = args[1].lower()
         
-        right_map = {
-            'r': AccessRight.READ,
-            'w': AccessRight.WRITE,
-            'x': AccessRight.EXECUTE,
-            't': AccessRight.TAKE,
-            'g': AccessRight.GRANT,
-            'o': AccessRight.OWN
-        }
-        
-        if right_str not in right_map:
+        if not all(r in _RIGHT_MAP for r in right_str.split(',')):
             print(f"Невідоме право: {right_str}")
             return
         
-        right = right_map[right_str]
+        # Маска прав: доступ дозволено, якщо можна отримати всі права
+        right = _parse_rights(right_str)
         if self.security.can_access(self.current_user_id, obj_id, right):
             print(f"Доступ до {obj_id} з правом {right_str} дозволено")
             self.audit.log_event(EventType.ACCESS_GRANTED, self.current_user_id,
@@ -434,16 +434,17 @@ class CLI:
         
         elif cmd == "list_objects":
             objs = self.admin.list_all_objects(self.current_user_id)
-            print("\nВсі об'єкти:")
-            for obj in objs:
-                print(f"  {obj['name']} ({obj['type']}) - ID: {obj['id']}, власник: {obj['owner']}")
+            print("\n".join([
+                "\nВсі об'єкти:",
+                *(f"  {obj['name']} ({obj['type']}) - ID: {obj['id']}, власник: {obj['owner']}"
+                  for obj in objs)]))
         
         elif cmd == "matrix":
             matrix = self.admin.get_access_matrix(self.current_user_id)
-            print("\nМатриця доступу:")
-            for entry in matrix:
-                rights_str = ",".join(entry['rights'])
-                print(f"  {entry['subject']} -> {entry['object']}: {rights_str}")
+            print("\n".join([
+                "\nМатриця доступу:",
+                *(f"  {entry['subject']} -> {entry['object']}: {','.join(entry['rights'])}"
+                  for entry in matrix)]))
         
         elif cmd == "grant":
             if len(args) < 4:
@@ -453,21 +454,7 @@ class CLI:
             obj = args[2]
             rights_str = args[3]
             
-            rights = set()
-            for r in rights_str.split(','):
-                r = r.strip().lower()
-                if r == 'r':
-                    rights.add(AccessRight.READ)
-                elif r == 'w':
-                    rights.add(AccessRight.WRITE)
-                elif r == 'x':
-                    rights.add(AccessRight.EXECUTE)
-                elif r == 't':
-                    rights.add(AccessRight.TAKE)
-                elif r == 'g':
-                    rights.add(AccessRight.GRANT)
-                elif r == 'o':
-                    rights.add(AccessRight.OWN)
+            rights = _parse_rights(rights_str)
             
             if self.admin.grant_rights(self.current_user_id, subject, obj, rights):
                 print(f"Права {rights_str} надано {subject} до {obj}")
@@ -491,9 +478,8 @@ class CLI:
         cmd = args[0].lower()
         
         if cmd == "all":
-            events = self.audit.get_all_events()
-            print(f"\nВсього подій: {len(events)}")
-            for event in events[-20:]:  # Останні 20 подій
+            print(f"\nВсього подій: {self.audit.count_events()}")
+            for event in self.audit.recent(20):  # Останні 20 подій
                 status = "✓" if event['success'] else "✗"
                 print(f"  {status} [{event['timestamp']}] {event['type']} - {event['subject']}")
         
@@ -504,9 +490,8 @@ class CLI:
                 print(f"  [{event['timestamp']}] {event['type']} - {event['subject']}")
         
         elif cmd == "success":
-            events = self.audit.get_successful_operations()
-            print(f"\nУспішні операції: {len(events)}")
-            for event in events[-20:]:  # Останні 20 подій
+            print(f"\nУспішні операції: {self.audit.count_events(success_only=True)}")
+            for event in self.audit.recent(20, lambda e: e['success']):  # Останні 20 подій
                 print(f"  [{event['timestamp']}] {event['type']} - {event['subject']}")
         
         else:
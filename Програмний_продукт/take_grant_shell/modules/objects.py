@@ -2,8 +2,10 @@
 Модуль однозначної ідентифікації об'єктів
 """
 
+import sys
+import time
 import uuid
-from typing import Dict, Set, Optional
+from typing import Dict, Optional, List, Iterator
 from enum import Enum
 
 
@@ -14,17 +16,69 @@ class ObjectType(Enum):
     SUBJECT = "subject"  # Суб'єкт також є об'єктом
 
 
+class ObjectRecord:
+    """
+    Запис про об'єкт системи
+    
+    Атрибути зберігаються у слотах (__slots__): запис займає менше пам'яті,
+    ніж словник, а доступ до полів не потребує хешування ключів.
+    """
+    
+    __slots__ = ('id', 'name', 'type', 'owner', 'parent_id', 'created_at')
+    
+    def __init__(self, id: str, name: str, type: str, owner: str,
+                 parent_id: Optional[str], created_at: float):
+        """
+        Args:
+            id: ID об'єкта
+            name: Ім'я об'єкта
+            type: Тип об'єкта (значення ObjectType)
+            owner: Власник об'єкта
+            parent_id: ID батьківського каталогу
+            created_at: Час створення (секунди від епохи)
+        """
+        self.id = id
+        self.name = name
+        self.type = type
+        self.owner = owner
+        self.parent_id = parent_id
+        self.created_at = created_at
+    
+    def to_dict(self) -> Dict:
+        """Представлення запису у вигляді словника (для зовнішніх викликів)"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'type': self.type,
+            'owner': self.owner,
+            'parent_id': self.parent_id,
+            'created_at': self.created_at
+        }
+    
+    def __repr__(self) -> str:
+        return f"ObjectRecord(id={self.id!r}, name={self.name!r}, type={self.type!r})"
+
+
 class ObjectIdentifier:
     """Модуль для ідентифікації об'єктів"""
     
     def __init__(self):
         """Ініціалізація модуля ідентифікації"""
-        self.objects: Dict[str, Dict] = {}  # object_id -> {type, name, owner, ...}
+        self.objects: Dict[str, ObjectRecord] = {}  # object_id -> запис об'єкта
         self.name_to_id: Dict[str, str] = {}  # name -> object_id (для швидкого пошуку)
+        # parent_id -> {object_id: запис}; словник зберігає порядок створення
+        self.children_by_parent: Dict[str, Dict[str, ObjectRecord]] = {}
     
     def generate_id(self) -> str:
-        """Генерація унікального ідентифікатора об'єкта"""
-        return str(uuid.uuid4())
+        """
+        Генерація унікального ідентифікатора об'єкта
+        
+        Використовується випадковий UUID4: ID об'єктів і імена користувачів
+        - вузли одного графа доступу, тому ID не повинен бути передбачуваним
+        (інакше користувач міг би заздалегідь зареєструватися під ім'ям
+        майбутнього об'єкта і збігтися з ним у графі).
+        """
+        return sys.intern(str(uuid.uuid4()))
     
     def create_object(self, name: str, obj_type: ObjectType, owner: str, 
                      parent_id: Optional[str] = None) -> str:
@@ -40,23 +94,21 @@ class ObjectIdentifier:
         Returns:
             ID створеного об'єкта
         """
-        # Перевірка на унікальність імені
-        if name in self.name_to_id:
+        object_id = self.generate_id()
+        
+        # Перевірка унікальності імені та реєстрація імені - одна операція
+        # зі словником: setdefault повертає наявний ID, якщо ім'я зайняте
+        if self.name_to_id.setdefault(name, object_id) != object_id:
             raise ValueError(f"Об'єкт з ім'ям '{name}' вже існує")
         
-        object_id = self.generate_id()
-        self.objects[object_id] = {
-            'id': object_id,
-            'name': name,
-            'type': obj_type.value,
-            'owner': owner,
-            'parent_id': parent_id,
-            'created_at': str(uuid.uuid1().time)
-        }
-        self.name_to_id[name] = object_id
+        record = ObjectRecord(object_id, name, obj_type.value, owner,
+                              parent_id, time.time())
+        self.objects[object_id] = record
+        if parent_id:
+            self.children_by_parent.setdefault(parent_id, {})[object_id] = record
         return object_id
     
-    def get_object(self, identifier: str) -> Optional[Dict]:
+    def get_object(self, identifier: str) -> Optional[ObjectRecord]:
         """
         Отримання об'єкта за ID або ім'ям
         
@@ -64,18 +116,15 @@ class ObjectIdentifier:
             identifier: ID або ім'я об'єкта
             
         Returns:
-            Словник з даними об'єкта або None
+            Запис об'єкта або None
         """
-        # Спочатку перевіряємо чи це ID
-        if identifier in self.objects:
-            return self.objects[identifier]
-        
-        # Якщо ні, шукаємо за ім'ям
-        if identifier in self.name_to_id:
-            object_id = self.name_to_id[identifier]
-            return self.objects[object_id]
-        
-        return None
+        # Спочатку перевіряємо чи це ID, якщо ні - шукаємо за ім'ям
+        obj = self.objects.get(identifier)
+        if obj is None:
+            object_id = self.name_to_id.get(identifier)
+            if object_id is not None:
+                obj = self.objects[object_id]
+        return obj
     
     def get_object_id(self, identifier: str) -> Optional[str]:
         """
@@ -87,13 +136,10 @@ class ObjectIdentifier:
         Returns:
             ID об'єкта або None
         """
+        # ID має пріоритет над ім'ям (як і в get_object)
         if identifier in self.objects:
             return identifier
-        
-        if identifier in self.name_to_id:
-            return self.name_to_id[identifier]
-        
-        return None
+        return self.name_to_id.get(identifier)
     
     def delete_object(self, identifier: str) -> bool:
         """
@@ -110,37 +156,70 @@ class ObjectIdentifier:
             return False
         
         obj = self.objects[object_id]
-        name = obj['name']
+        name = obj.name
         
         # Видаляємо з обох словників
         del self.objects[object_id]
-        if name in self.name_to_id:
-            del self.name_to_id[name]
+        self.name_to_id.pop(name, None)
+        
+        # Видаляємо з індексу вкладеності (порожні записи не зберігаємо)
+        siblings = self.children_by_parent.get(obj.parent_id)
+        if siblings is not None:
+            siblings.pop(object_id, None)
+            if not siblings:
+                del self.children_by_parent[obj.parent_id]
+        self.children_by_parent.pop(object_id, None)
         
         return True
     
-    def list_objects(self, obj_type: Optional[ObjectType] = None, 
-                    owner: Optional[str] = None) -> list:
+    def iter_objects(self, obj_type: Optional[ObjectType] = None,
+                     owner: Optional[str] = None) -> Iterator[ObjectRecord]:
         """
-        Отримання списку об'єктів з фільтрацією
+        Перелік об'єктів з фільтрацією (генератор, без побудови списку)
         
         Args:
             obj_type: Фільтр за типом (None - всі типи)
             owner: Фільтр за власником (None - всі власники)
             
         Returns:
-            Список об'єктів
+            Ітератор записів об'єктів
         """
-        result = []
+        type_value = obj_type.value if obj_type else None
         for obj in self.objects.values():
-            if obj_type and obj['type'] != obj_type.value:
+            if type_value and obj.type != type_value:
                 continue
-            if owner and obj['owner'] != owner:
+            if owner and obj.owner != owner:
                 continue
-            result.append(obj)
-        return result
+            yield obj
+    
+    def list_objects(self, obj_type: Optional[ObjectType] = None, 
+                    owner: Optional[str] = None) -> List[ObjectRecord]:
+        """
+        Отримання списку об'єктів з фільтрацією
+        
+        Args:
+            obj_type: Фільтр за типом (None - всі типи)
+            owner: Фільтр за власником (None - всі власники)
+            
+        Returns:
+            Список об'єктів
+        """
+        return list(self.iter_objects(obj_type, owner))
+    
+    def get_children(self, parent_id: str) -> List[ObjectRecord]:
+        """
+        Отримання об'єктів, вкладених у каталог
+        
+        Args:
+            parent_id: ID батьківського каталогу
+            
+        Returns:
+            Список дочірніх об'єктів у порядку створення
+        """
+        children = self.children_by_parent.get(parent_id)
+        return list(children.values()) if children else []
     
-    def get_objects_by_owner(self, owner: str) -> list:
+    def get_objects_by_owner(self, owner: str) -> List[ObjectRecord]:
         """Отримання всіх об'єктів власника"""
         return self.list_objects(owner=owner)
     
@@ -8,6 +8,13 @@ from .access_graph import AccessGraph, AccessRight
 from .security_kernel import SecurityKernel
 
 
+# Права доступу як глобальні імена модуля (без пошуку атрибутів AccessRight)
+READ = AccessRight.READ
+WRITE = AccessRight.WRITE
+EXECUTE = AccessRight.EXECUTE
+OWN = AccessRight.OWN
+
+
 class OperationsModule:
     """
     Модуль для виконання операцій над об'єктами
@@ -44,11 +51,11 @@ class OperationsModule:
         """
         # Перевірка доступу
         if not self.security_kernel.can_access(subject_id, object_id, 
-                                               AccessRight.READ):
+                                               READ):
             return None
         
         obj = self.object_identifier.get_object(object_id)
-        if not obj or obj['type'] != ObjectType.FILE.value:
+        if not obj or obj.type != ObjectType.FILE.value:
             return None
         
         return self.file_contents.get(object_id, "")
@@ -67,11 +74,11 @@ class OperationsModule:
         """
         # Перевірка доступу
         if not self.security_kernel.can_access(subject_id, object_id,
-                                              AccessRight.WRITE):
+                                              WRITE):
             return False
         
         obj = self.object_identifier.get_object(object_id)
-        if not obj or obj['type'] != ObjectType.FILE.value:
+        if not obj or obj.type != ObjectType.FILE.value:
             return False
         
         self.file_contents[object_id] = content
@@ -90,11 +97,11 @@ class OperationsModule:
         """
         # Перевірка доступу
         if not self.security_kernel.can_access(subject_id, object_id,
-                                              AccessRight.EXECUTE):
+                                              EXECUTE):
             return False
         
         obj = self.object_identifier.get_object(object_id)
-        if not obj or obj['type'] != ObjectType.FILE.value:
+        if not obj or obj.type != ObjectType.FILE.value:
             return False
         
         # Симуляція виконання (в реальній системі тут була б виконана програма)
@@ -169,24 +176,19 @@ class OperationsModule:
             return False
         
         # Перевірка: тільки власник може видалити об'єкт
-        if obj['owner'] != subject_id:
+        if obj.owner != subject_id:
             # Або перевіряємо чи має право OWN
             if not self.security_kernel.can_access(subject_id, object_id,
-                                                  AccessRight.OWN):
+                                                  OWN):
                 return False
         
         # Видаляємо з файлової системи
         if object_id in self.file_contents:
             del self.file_contents[object_id]
         
-        # Видаляємо всі права доступу до цього об'єкта
-        edges_to_remove = []
-        for (s, o), rights in self.access_graph.graph.items():
-            if o == object_id:
-                edges_to_remove.append((s, o))
-        
-        for s, o in edges_to_remove:
-            del self.access_graph.graph[(s, o)]
+        # Видаляємо всі права доступу до цього об'єкта та права самого
+        # об'єкта (за індексами суміжності, без перегляду всього графа)
+        self.access_graph.remove_node_edges(object_id)
         
         # Видаляємо з ідентифікатора
         return self.object_identifier.delete_object(object_id)
@@ -204,21 +206,15 @@ class OperationsModule:
         """
         # Перевірка доступу до каталогу
         if not self.security_kernel.can_access(subject_id, directory_id,
-                                              AccessRight.READ):
+                                              READ):
             return []
         
         obj = self.object_identifier.get_object(directory_id)
-        if not obj or obj['type'] != ObjectType.DIRECTORY.value:
+        if not obj or obj.type != ObjectType.DIRECTORY.value:
             return []
         
-        # Знаходимо всі об'єкти з цим батьківським каталогом
-        all_objects = self.object_identifier.list_objects()
-        result = []
-        for obj in all_objects:
-            if obj.get('parent_id') == directory_id:
-                result.append(obj)
-        
-        return result
+        # Вміст каталогу береться з індексу вкладеності, без перегляду всіх об'єктів
+        return self.object_identifier.get_children(directory_id)
     
     def get_file_content(self, object_id: str) -> str:
         """Отримання вмісту файлу (без перевірки доступу)"""
@@ -0,0 +1,18 @@
+"""
+Шляхи до файлів даних та журналів оболонки
+
+Шляхи обчислюються один раз під час імпорту відносно кореня проєкту,
+тому не залежать від поточної робочої директорії.
+"""
+
+from pathlib import Path
+
+# Корінь проєкту (директорія з main.py)
+BASE = Path(__file__).resolve().parent.parent
+
+DATA = BASE / "data"
+LOGS = BASE / "logs"
+
+SYSTEM_JSON = DATA / "system.json"
+AUDIT_LOG = LOGS / "audit.log"
+AUDIT_JSON = DATA / "audit.jsonl"
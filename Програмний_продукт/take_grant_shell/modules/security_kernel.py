@@ -2,8 +2,13 @@
 Модуль ядра безпеки - перевірка доступу з використанням DFS
 """
 
-from typing import Set, Optional, List
-from .access_graph import AccessGraph, AccessRight
+from collections import OrderedDict, deque
+from typing import Dict, Set, Optional, List, Tuple
+from .access_graph import AccessGraph, AccessRight, TAKE_BIT, GRANT_BIT
+
+
+# Максимальна кількість результатів перевірок доступу у кеші ядра
+_ACCESS_CACHE_SIZE = 4096
 
 
 class SecurityKernel:
@@ -20,6 +25,26 @@ class SecurityKernel:
             access_graph: Граф доступу
         """
         self.access_graph = access_graph
+        # Кеш результатів can_access: (subject, object, right) -> bool,
+        # дійсний для версії графа self._cache_version (витіснення LRU)
+        self._cache: "OrderedDict[Tuple[str, str, AccessRight], bool]" = OrderedDict()
+        # Кеш get_accessible_objects: (subject, right) -> множина об'єктів
+        self._accessible_cache: Dict[Tuple[str, AccessRight], Set[str]] = {}
+        self._cache_version = access_graph.version
+        # Множина відвіданих вузлів і стек обходу _take_path, спільні для
+        # всіх запитів (очищуються на початку кожного пошуку, а не
+        # створюються заново). Ядро не реентерабельне: для паралельних
+        # перевірок потрібен пул таких структур на кожен потік
+        self._visited: Set[str] = set()
+        self._stack: List[str] = []
+    
+    def _check_version(self):
+        """Скидання кешів, якщо граф змінився після їх заповнення"""
+        version = self.access_graph.version
+        if version != self._cache_version:
+            self._cache.clear()
+            self._accessible_cache.clear()
+            self._cache_version = version
     
     def can_access(self, subject_id: str, object_id: str, 
                   required_right: AccessRight) -> bool:
@@ -37,12 +62,28 @@ class SecurityKernel:
         Returns:
             True якщо доступ можливий
         """
-        # Спочатку перевіряємо чи є пряме право
-        if self.access_graph.has_right(subject_id, object_id, required_right):
-            return True
+        # Порожня маска не описує жодного права - доступ за нею не надається
+        # (інакше перевірки "всі права з маски є" були б завжди істинні)
+        if not required_right:
+            return False
+        
+        self._check_version()
+        cache = self._cache
+        key = (subject_id, object_id, required_right)
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
         
-        # Якщо немає прямого доступу, шукаємо шлях через take/grant
-        return self._find_access_path(subject_id, object_id, required_right)
+        # Спочатку перевіряємо чи є пряме право, інакше
+        # шукаємо шлях через take/grant
+        result = (self.access_graph.has_right(subject_id, object_id, required_right) or
+                  self._find_access_path(subject_id, object_id, required_right))
+        
+        cache[key] = result
+        if len(cache) > _ACCESS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
     
     def _find_access_path(self, subject_id: str, object_id: str,
                           required_right: AccessRight) -> bool:
@@ -54,75 +95,119 @@ class SecurityKernel:
         2. Для кожного такого об'єкта перевіряємо чи він має доступ до target
         3. Якщо так, то subject може отримати доступ через take
         4. Аналогічно для grant - шукаємо суб'єктів, які можуть надати доступ
+        
+        Returns:
+            True якщо знайдено шлях
         """
-        visited = set()
-        return self._dfs_search(subject_id, object_id, required_right, visited)
+        required = int(required_right)
+        
+        # Якщо CSR-представлення вже побудоване для поточного покоління
+        # (наприклад, після перегляду матриці доступу), обхід іде по
+        # цілочисельних масивах; примусова перебудова CSR заради одного
+        # запиту не окупилась би, тому інакше - обхід словника графа
+        if self.access_graph.csr_is_current():
+            found = self._take_path_csr(subject_id, object_id, required)
+        else:
+            found = self._take_path(subject_id, object_id, required)
+        return found or self._grant_path(object_id, required)
     
-    def _dfs_search(self, current_subject: str, target_object: str,
-                   required_right: AccessRight, visited: Set[str]) -> bool:
+    def _take_path(self, subject_id: str, object_id: str, required: int) -> bool:
         """
-        Рекурсивний пошук у глибину (DFS)
+        Пошук вузла з потрібним правом у замиканні subject_id за ребрами 't'
         
         Args:
-            current_subject: Поточний суб'єкт
-            target_object: Цільовий об'єкт
-            required_right: Необхідне право
-            visited: Множина відвіданих вузлів (для уникнення циклів)
+            subject_id: ID суб'єкта
+            object_id: ID цільового об'єкта
+            required: Маска необхідних прав
             
         Returns:
-            True якщо знайдено шлях
+            True якщо знайдено шлях через take
         """
-        # Уникаємо циклів
-        if current_subject in visited:
-            return False
-        visited.add(current_subject)
+        # Обчислюється досяжність (чи існує хоч один шлях), тому всі гілки
+        # пошуку ділять одну множину відвіданих вузлів. Обхід ітеративний:
+        # явний стек замість рекурсії - без кадрів інтерпретатора на кожен
+        # вузол і без обмеження глибини ланцюжків 't'
+        access_graph = self.access_graph
+        # Права перевіряються прямо за масками графа: один пошук у словнику
+        # та побітове & над цілими числами на кожну перевірку.
+        # Методи, що викликаються в циклі, прив'язуються до локальних імен
+        graph_get = access_graph.graph.get
+        get_subject_objects = access_graph.get_subject_objects
         
-        # Перевірка прямого доступу
-        if self.access_graph.has_right(current_subject, target_object, required_right):
-            return True
-        
-        # Шукаємо через операцію TAKE
-        # Знаходимо об'єкти, до яких current_subject має право 't'
-        objects_with_take = self.access_graph.get_subject_objects(current_subject)
-        
-        for intermediate_object in objects_with_take:
-            # Перевіряємо чи має current_subject право 't' до intermediate_object
-            if not self.access_graph.has_right(current_subject, intermediate_object, 
-                                             AccessRight.TAKE):
-                continue
+        visited = self._visited
+        visited.clear()
+        visited.add(subject_id)
+        visited_add = visited.add
+        stack = self._stack
+        stack.clear()  # Після раннього виходу у стеку могли лишитися вузли
+        stack.append(subject_id)
+        stack_pop = stack.pop
+        stack_append = stack.append
+        while stack:
+            current_subject = stack_pop()
             
-            # Перевіряємо чи має intermediate_object доступ до target_object
-            if self.access_graph.has_right(intermediate_object, target_object, 
-                                         required_right):
-                # Знайдено шлях через take!
+            # Перевірка прямого доступу вузла до цільового об'єкта
+            if graph_get((current_subject, object_id), 0) & required == required:
                 return True
             
-            # Рекурсивно шукаємо далі через intermediate_object
-            # (якщо intermediate_object є суб'єктом)
-            if self._dfs_search(intermediate_object, target_object, 
-                              required_right, visited.copy()):
-                return True
+            # Шукаємо через операцію TAKE: об'єкти, до яких current_subject
+            # має право 't', стають наступними вузлами обходу
+            for intermediate_object in get_subject_objects(current_subject):
+                if (intermediate_object not in visited and
+                        graph_get((current_subject, intermediate_object), 0) & TAKE_BIT):
+                    visited_add(intermediate_object)
+                    stack_append(intermediate_object)
         
-        # Шукаємо через операцію GRANT
-        # Знаходимо суб'єктів, які мають право 'g' до об'єктів з доступом до target
-        all_objects = set()
-        for (s, o), rights in self.access_graph.graph.items():
-            all_objects.add(o)
+        return False
+    
+    def _take_path_csr(self, subject_id: str, object_id: str, required: int) -> bool:
+        """
+        Те саме, що _take_path, але по CSR-масивах графа
         
-        for intermediate_object in all_objects:
-            # Знаходимо суб'єктів, які мають право 'g' до intermediate_object
-            subjects_with_grant = self.access_graph.get_object_subjects(intermediate_object)
-            
-            for grant_subject in subjects_with_grant:
-                if not self.access_graph.has_right(grant_subject, intermediate_object,
-                                                 AccessRight.GRANT):
-                    continue
-                
-                # Перевіряємо чи має intermediate_object доступ до target_object
-                if self.access_graph.has_right(intermediate_object, target_object,
-                                             required_right):
-                    # Можливий шлях через grant (якщо grant_subject надасть доступ)
-                    # Для спрощення вважаємо що це можливо
+        Вузли - цілі індекси, відвідані вузли - bytearray, маски ребер
+        читаються з rights_arr без пошуку в словнику.
+        """
+        access_graph = self.access_graph
+        start = access_graph.node_index.get(subject_id)
+        target = access_graph.node_index.get(object_id)
+        if start is None or target is None:
+            return False  # Вузол без жодного ребра
+        
+        row_ptr, col_idx, rights_arr = access_graph.get_csr()
+        visited = bytearray(len(row_ptr) - 1)
+        visited[start] = 1
+        stack = [start]
+        stack_pop = stack.pop
+        stack_append = stack.append
+        while stack:
+            node = stack_pop()
+            for pos in range(row_ptr[node], row_ptr[node + 1]):
+                neighbor = col_idx[pos]
+                mask = rights_arr[pos]
+                if neighbor == target and mask & required == required:
+                    return True
+                if mask & TAKE_BIT and not visited[neighbor]:
+                    visited[neighbor] = 1
+                    stack_append(neighbor)
+        
+        return False
+    
+    def _grant_path(self, object_id: str, required: int) -> bool:
+        """
+        Пошук шляху через grant: вузол з потрібним правом до object_id,
+        до якого хтось має право 'g' (і може надати доступ)
+        
+        Кандидати беруться з індексу суміжності - лише вхідні ребра object_id.
+        """
+        graph_get = self.access_graph.graph.get
+        get_object_subjects = self.access_graph.get_object_subjects
+        
+        for intermediate_object in get_object_subjects(object_id):
+            if graph_get((intermediate_object, object_id), 0) & required != required:
+                continue
+            for grant_subject in get_object_subjects(intermediate_object):
+                if graph_get((grant_subject, intermediate_object), 0) & GRANT_BIT:
+                    # Для спрощення вважаємо що grant_subject надасть доступ
                     return True
         
         return False
@@ -132,6 +217,12 @@ class SecurityKernel:
         """
         Отримання списку об'єктів, до яких суб'єкт може отримати доступ
         
+        Замість окремої перевірки can_access для кожного об'єкта виконується
+        один обхід у ширину: об'єкт доступний, якщо право на нього має
+        вузол, досяжний із subject_id ланцюжком ребер 't' (включно із самим
+        суб'єктом), або вузол, до якого хтось має право 'g' (як у
+        _dfs_search). Результат кешується до наступної зміни графа.
+        
         Args:
             subject_id: ID суб'єкта
             required_right: Необхідне право
@@ -139,17 +230,48 @@ class SecurityKernel:
         Returns:
             Список ID об'єктів
         """
-        accessible = []
+        if not required_right:
+            return []  # Порожня маска - як у can_access
+        
+        self._check_version()
+        key = (subject_id, required_right)
+        accessible = self._accessible_cache.get(key)
+        if accessible is None:
+            accessible = self._collect_accessible(subject_id, required_right)
+            self._accessible_cache[key] = accessible
+        return list(accessible)
+    
+    def _collect_accessible(self, subject_id: str,
+                            required_right: AccessRight) -> Set[str]:
+        """Обхід у ширину для get_accessible_objects"""
+        graph = self.access_graph.graph
+        objects_by_subject_get = self.access_graph.objects_by_subject.get
+        required = int(required_right)
+        accessible: Set[str] = set()
+        accessible_add = accessible.add
         
-        # Отримуємо всі об'єкти з графа
-        all_objects = set()
-        for (s, o), rights in self.access_graph.graph.items():
-            all_objects.add(o)
-            all_objects.add(s)  # Суб'єкти теж можуть бути об'єктами
+        # Замикання subject_id за ребрами 't'
+        closure = {subject_id}
+        closure_add = closure.add
+        queue = deque(closure)
+        queue_popleft = queue.popleft
+        queue_append = queue.append
+        while queue:
+            node = queue_popleft()
+            for obj in objects_by_subject_get(node, ()):
+                rights = graph[(node, obj)]
+                if rights & required == required:
+                    accessible_add(obj)
+                if rights & TAKE_BIT and obj not in closure:
+                    closure_add(obj)
+                    queue_append(obj)
         
-        for object_id in all_objects:
-            if self.can_access(subject_id, object_id, required_right):
-                accessible.append(object_id)
+        # Гілка grant: вузли, до яких хтось має право 'g'
+        for node, subjects in self.access_graph.subjects_by_object.items():
+            if any(graph[(s, node)] & GRANT_BIT for s in subjects):
+                for obj in objects_by_subject_get(node, ()):
+                    if graph[(node, obj)] & required == required:
+                        accessible_add(obj)
         
         return accessible
     
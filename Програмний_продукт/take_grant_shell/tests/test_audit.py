@@ -0,0 +1,95 @@
+"""
+Тести модуля аудиту: операції, що працюють з файлами журналу
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.audit import AuditModule, EventType
+
+
+class AuditFileTest(unittest.TestCase):
+    """Публічні методи AuditModule, які змінюють файли журналу"""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self._tmp.name, "logs", "audit.log")
+        self.jsonl_file = os.path.join(self._tmp.name, "data", "audit.jsonl")
+        self.audit = self._open()
+    
+    def tearDown(self):
+        self.audit.close()
+        self._tmp.cleanup()
+    
+    def _open(self) -> AuditModule:
+        """Новий модуль аудиту над тими самими файлами"""
+        return AuditModule(self.log_file, self.jsonl_file)
+    
+    def _reload(self) -> AuditModule:
+        """Закриття поточного модуля та читання журналу з файлу заново"""
+        self.audit.close()
+        self.audit = self._open()
+        return self.audit
+    
+    def test_clear_events_then_log(self):
+        self.audit.log_event(EventType.LOGIN, "alice")
+        self.audit.clear_events()
+        self.audit.log_event(EventType.LOGOUT, "alice")
+        
+        events = self._reload().get_all_events()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['type'], EventType.LOGOUT.value)
+        with open(self.log_file, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+    
+    def test_clear_events_after_torn_line(self):
+        self.audit.close()
+        with open(self.jsonl_file, 'ab') as f:
+            f.write(b'{"timestamp": "t", "ty')
+        self.audit = self._open()
+        
+        self.audit.clear_events()
+        self.audit.log_event(EventType.LOGIN, "alice")
+        self.audit.save_events()
+        with open(self.jsonl_file, 'rb') as f:
+            self.assertFalse(f.read().startswith(b"\n"))
+    
+    def test_save_events(self):
+        self.audit.log_event(EventType.LOGIN, "alice")
+        self.audit.save_events()
+        with open(self.jsonl_file, 'rb') as f:
+            self.assertEqual(len(f.readlines()), 1)
+        with open(self.log_file, encoding='utf-8') as f:
+            self.assertIn("subject=alice", f.read())
+    
+    def test_compact(self):
+        for subject in ("alice", "bob"):
+            self.audit.log_event(EventType.LOGIN, subject)
+        self.audit.compact()
+        self.audit.log_event(EventType.LOGOUT, "bob")
+        
+        events = self._reload().get_all_events()
+        self.assertEqual([e['subject'] for e in events], ["alice", "bob", "bob"])
+    
+    def test_close_flushes_queue(self):
+        for i in range(1000):
+            self.audit.log_event(EventType.READ_FILE, "alice", {'n': i})
+        
+        audit = self._reload()
+        self.assertEqual(audit.count_events(), 1000)
+        self.assertEqual(audit.tail(1)[0]['details'], {'n': 999})
+    
+    def test_close_twice(self):
+        self.audit.log_event(EventType.LOGIN, "alice")
+        self.audit.close()
+        self.audit.close()
+        self.assertEqual(self._reload().count_events(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
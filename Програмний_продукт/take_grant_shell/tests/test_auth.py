@@ -0,0 +1,50 @@
+"""
+Тести модуля автентифікації: завантаження даних користувачів
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.auth import AuthenticationModule
+
+
+class LoadDataTest(unittest.TestCase):
+    """Записи користувачів з пошкодженим хешем пароля"""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self._tmp.name, "system.json")
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_bad_password_hash_disables_only_that_user(self):
+        auth = AuthenticationModule(self.data_file)
+        auth.register("alice", "password123")
+        auth.save_data()
+        
+        with open(self.data_file, encoding='utf-8') as f:
+            data = json.load(f)
+        data['users']['nohash'] = {'is_admin': False}
+        data['users']['badhex'] = {'password_hash': 'zz', 'is_admin': False}
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        
+        with redirect_stderr(StringIO()):
+            auth = AuthenticationModule(self.data_file)
+        self.assertFalse(auth.login("nohash", ""))
+        self.assertFalse(auth.login("badhex", "zz"))
+        self.assertTrue(auth.login("alice", "password123"))
+        self.assertFalse(auth.login("alice", "wrong"))
+
+
+if __name__ == "__main__":
+    unittest.main()
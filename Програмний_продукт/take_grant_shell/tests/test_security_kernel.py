@@ -0,0 +1,85 @@
+"""
+Тести ядра безпеки: обхід замикання 't' по словнику графа та по CSR
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.access_graph import AccessGraph, AccessRight
+from modules.security_kernel import SecurityKernel
+
+
+# Маски, що перевіряються: окремі права та комбінації
+_MASKS = [int(right) for right in AccessRight if right != AccessRight.ALL] + [3, 9, 63]
+
+
+def _random_graph(rng: random.Random, node_count: int, steps: int) -> AccessGraph:
+    """Випадковий граф з додаванням і видаленням прав"""
+    graph = AccessGraph()
+    for _ in range(steps):
+        subject_id = f"n{rng.randrange(node_count)}"
+        object_id = f"n{rng.randrange(node_count)}"
+        mask = AccessRight(rng.randint(1, 63))
+        if rng.random() < 0.8:
+            graph.add_right(subject_id, object_id, mask)
+        else:
+            graph.remove_right(subject_id, object_id, mask)
+    return graph
+
+
+class TakePathTest(unittest.TestCase):
+    """_take_path та _take_path_csr повинні давати однаковий результат"""
+    
+    def _assert_same(self, graph: AccessGraph, node_ids):
+        kernel = SecurityKernel(graph)
+        for subject_id in node_ids:
+            for object_id in node_ids:
+                for mask in _MASKS:
+                    expected = kernel._take_path(subject_id, object_id, mask)
+                    graph.get_csr()
+                    self.assertEqual(
+                        kernel._take_path_csr(subject_id, object_id, mask), expected,
+                        (subject_id, object_id, mask))
+    
+    def test_random_graphs(self):
+        rng = random.Random(2024)
+        for _ in range(200):
+            node_count = rng.randint(2, 8)
+            graph = _random_graph(rng, node_count, rng.randint(0, 30))
+            # Вузол поза графом перевіряє гілку без індексу вузла
+            self._assert_same(graph, [f"n{i}" for i in range(node_count)] + ["missing"])
+    
+    def test_long_take_chain(self):
+        graph = AccessGraph()
+        for i in range(5000):
+            graph.add_right(f"n{i}", f"n{i + 1}", AccessRight.TAKE)
+        graph.add_right("n5000", "file", AccessRight.READ)
+        kernel = SecurityKernel(graph)
+        
+        self.assertTrue(kernel._take_path("n0", "file", int(AccessRight.READ)))
+        graph.get_csr()
+        self.assertTrue(kernel._take_path_csr("n0", "file", int(AccessRight.READ)))
+        self.assertFalse(kernel._take_path_csr("n0", "file", int(AccessRight.WRITE)))
+    
+    def test_can_access_with_and_without_csr(self):
+        rng = random.Random(7)
+        for _ in range(100):
+            node_count = rng.randint(2, 6)
+            graph = _random_graph(rng, node_count, rng.randint(0, 20))
+            node_ids = [f"n{i}" for i in range(node_count)]
+            queries = [(s, o, AccessRight(m)) for s in node_ids for o in node_ids
+                       for m in _MASKS]
+            
+            dict_results = [SecurityKernel(graph).can_access(*q) for q in queries]
+            graph.get_csr()
+            self.assertTrue(graph.csr_is_current())
+            csr_results = [SecurityKernel(graph).can_access(*q) for q in queries]
+            self.assertEqual(dict_results, csr_results)
+
+
+if __name__ == "__main__":
+    unittest.main()